@@ -182,12 +182,9 @@ class ApplicationController(QObject):
 
     def _setup_audio_level_callback(self):
         """Setup audio level callback for waveform display."""
-        def audio_level_callback(level: float):
-            # Convert single level to list for compatibility
-            levels = [level] * 20  # Duplicate for all bars
-            self.ui_controller.update_audio_levels(levels)
-
-        self.recorder.set_audio_level_callback(audio_level_callback)
+        # The same level drives every bar; the controller coalesces updates
+        # to one per display frame
+        self.recorder.set_audio_level_callback(self.ui_controller.update_audio_level)
 
     def _connect_signals(self):
         """Connect Qt signals to UI controller methods."""
@@ -537,13 +534,13 @@ class ApplicationController(QObject):
                 if local_backend and hasattr(local_backend, 'device_info'):
                     model_info = f"local_whisper ({local_backend.device_info})"
 
-            history_manager.add_entry(
+            entry = history_manager.add_entry(
                 text=transcribed_text,
                 model=model_info,
                 source_audio_file=self._pending_audio_file
             )
-            # Refresh the history sidebar
-            self.ui_controller.refresh_history()
+            # Show the new entry in the history sidebar
+            self.ui_controller.add_history_entry(entry)
             logging.info("Transcription saved to history")
         except Exception as e:
             logging.error(f"Failed to save transcription to history: {e}")
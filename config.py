@@ -39,6 +39,7 @@ class AppConfig:
     )
     
     MODEL_VALUE_MAP: Dict[str, str] = None
+    MODEL_DISPLAY_MAP: Dict[str, str] = None  # Inverse of MODEL_VALUE_MAP
 
     # Whisper model choices for faster-whisper
     WHISPER_MODEL_CHOICES: List[str] = None
@@ -114,6 +115,9 @@ class AppConfig:
                 'API: GPT-4o Mini Transcribe': 'api_gpt4o_mini'
             }
 
+        if self.MODEL_DISPLAY_MAP is None:
+            self.MODEL_DISPLAY_MAP = {v: k for k, v in self.MODEL_VALUE_MAP.items()}
+
         if self.WHISPER_MODEL_CHOICES is None:
             self.WHISPER_MODEL_CHOICES = [
                 # Auto-select based on hardware (turbo for GPU, base for CPU)
@@ -109,6 +109,8 @@ class HistoryManager:
         
         self._lock = threading.Lock()
         self._history: List[HistoryEntry] = []
+        # Id index over _history for O(1) lookups; kept in sync under _lock
+        self._entries_by_id: Dict[str, HistoryEntry] = {}
         
         # Ensure recordings folder exists
         os.makedirs(self.recordings_folder, exist_ok=True)
@@ -127,10 +129,12 @@ class HistoryManager:
                             HistoryEntry.from_dict(entry) 
                             for entry in data.get('entries', [])
                         ]
+                        self._entries_by_id = {entry.id: entry for entry in self._history}
                     logging.info(f"Loaded {len(self._history)} history entries")
             except Exception as e:
                 logging.error(f"Failed to load history: {e}")
                 self._history = []
+                self._entries_by_id = {}
     
     def _save_history(self) -> None:
         """Save history to file."""
@@ -170,6 +174,7 @@ class HistoryManager:
         with self._lock:
             # Add to beginning (newest first)
             self._history.insert(0, entry)
+            self._entries_by_id[entry.id] = entry
             self._save_history()
         
         logging.info(f"Added history entry: {entry.id[:8]}...")
@@ -299,10 +304,7 @@ class HistoryManager:
             The HistoryEntry or None if not found.
         """
         with self._lock:
-            for entry in self._history:
-                if entry.id == entry_id:
-                    return entry
-        return None
+            return self._entries_by_id.get(entry_id)
     
     def delete_entry(self, entry_id: str) -> bool:
         """Delete a history entry.
@@ -314,19 +316,20 @@ class HistoryManager:
             True if deleted, False if not found.
         """
         with self._lock:
-            for i, entry in enumerate(self._history):
-                if entry.id == entry_id:
-                    # Don't delete the associated audio file - it may be used by other entries
-                    del self._history[i]
-                    self._save_history()
-                    logging.info(f"Deleted history entry: {entry_id[:8]}...")
-                    return True
-        return False
+            entry = self._entries_by_id.pop(entry_id, None)
+            if entry is None:
+                return False
+            # Don't delete the associated audio file - it may be used by other entries
+            self._history.remove(entry)
+            self._save_history()
+        logging.info(f"Deleted history entry: {entry_id[:8]}...")
+        return True
     
     def clear_history(self) -> None:
         """Clear all history entries (keeps recordings)."""
         with self._lock:
             self._history = []
+            self._entries_by_id = {}
             self._save_history()
         logging.info("History cleared")
     
@@ -269,7 +269,7 @@ class SettingsManager:
             selected_model = settings.get('selected_model')
             
             # Validate that the model exists in the available models
-            if selected_model and selected_model in config.MODEL_VALUE_MAP.values():
+            if selected_model and selected_model in config.MODEL_DISPLAY_MAP:
                 return selected_model
             
         except Exception as e:
@@ -292,8 +292,8 @@ class SettingsManager:
             raise ValueError("model_value must be a non-empty string")
         
         # Validate that the model exists in the available models
-        if model_value not in config.MODEL_VALUE_MAP.values():
-            valid_models = list(config.MODEL_VALUE_MAP.values())
+        if model_value not in config.MODEL_DISPLAY_MAP:
+            valid_models = list(config.MODEL_DISPLAY_MAP)
             raise ValueError(f"Invalid model '{model_value}'. Valid models: {valid_models}")
         
         try:
@@ -0,0 +1,73 @@
+"""
+Unit tests for hotkey capture in the hotkey dialog.
+"""
+import importlib.util
+import os
+import unittest
+
+if importlib.util.find_spec("PyQt6"):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtCore import QEvent, Qt
+    from PyQt6.QtGui import QKeyEvent
+    from PyQt6.QtWidgets import QApplication
+
+
+@unittest.skipUnless(importlib.util.find_spec("PyQt6"), "PyQt6 not installed")
+class TestHotkeyFromKeyEvent(unittest.TestCase):
+    """Captured hotkeys must use the key names the keyboard library reports."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the QApplication the key events need."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def _hotkey(self, key, modifiers=Qt.KeyboardModifier.NoModifier, text=""):
+        """Build a key press event and convert it to a hotkey string."""
+        from ui_qt.dialogs.hotkey_dialog import hotkey_from_key_event
+        event = QKeyEvent(QEvent.Type.KeyPress, key, modifiers, text)
+        return hotkey_from_key_event(event)
+
+    def test_plain_keys(self):
+        """Test keys whose Qt names already match the keyboard library."""
+        self.assertEqual(self._hotkey(Qt.Key.Key_F5), "f5")
+        self.assertEqual(self._hotkey(Qt.Key.Key_A, text="a"), "a")
+        self.assertEqual(self._hotkey(Qt.Key.Key_Home), "home")
+
+    def test_renamed_keys(self):
+        """Test keys whose Qt names differ from the keyboard library's."""
+        expected = {
+            Qt.Key.Key_Escape: "esc",
+            Qt.Key.Key_Return: "enter",
+            Qt.Key.Key_PageUp: "page up",
+            Qt.Key.Key_Delete: "delete",
+            Qt.Key.Key_Insert: "insert",
+            Qt.Key.Key_NumLock: "num lock",
+            Qt.Key.Key_ScrollLock: "scroll lock",
+            Qt.Key.Key_CapsLock: "caps lock",
+            Qt.Key.Key_Print: "print screen",
+        }
+        for key, name in expected.items():
+            with self.subTest(key=key):
+                self.assertEqual(self._hotkey(key), name)
+
+    def test_modifiers(self):
+        """Test that modifiers are prefixed in the keyboard library's order."""
+        modifiers = (Qt.KeyboardModifier.ControlModifier
+                     | Qt.KeyboardModifier.AltModifier
+                     | Qt.KeyboardModifier.KeypadModifier)
+        self.assertEqual(self._hotkey(Qt.Key.Key_Asterisk, modifiers, "*"), "ctrl+alt+*")
+        self.assertEqual(
+            self._hotkey(Qt.Key.Key_Delete, Qt.KeyboardModifier.ControlModifier),
+            "ctrl+delete",
+        )
+
+    def test_shift_tab(self):
+        """Test that Shift+Tab, reported by Qt as Backtab, records as shift+tab."""
+        self.assertEqual(
+            self._hotkey(Qt.Key.Key_Backtab, Qt.KeyboardModifier.ShiftModifier),
+            "shift+tab",
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""
+Import-time tests for the PyQt6 UI package.
+"""
+import importlib.util
+import subprocess
+import sys
+import unittest
+
+
+@unittest.skipUnless(importlib.util.find_spec("PyQt6"), "PyQt6 not installed")
+class TestMainWindowImports(unittest.TestCase):
+    """The main window must not import dialogs until they are opened."""
+
+    DEFERRED_MODULES = (
+        "ui_qt.dialogs.settings_dialog",
+        "ui_qt.dialogs.hotkey_dialog",
+        "ui_qt.loading_screen_qt",
+    )
+
+    def test_main_window_import_defers_dialogs(self):
+        """Test that importing the main window leaves dialog modules unloaded."""
+        code = (
+            "import sys\n"
+            "from ui_qt.main_window_qt import ModernMainWindow\n"
+            "print('\\n'.join(sorted(sys.modules)))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True,
+        )
+        loaded = set(result.stdout.split())
+        for module_name in self.DEFERRED_MODULES:
+            self.assertNotIn(module_name, loaded)
+
+
+if __name__ == '__main__':
+    unittest.main()
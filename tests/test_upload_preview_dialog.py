@@ -0,0 +1,62 @@
+"""
+Unit tests for the upload preview dialog.
+"""
+import importlib.util
+import os
+import unittest
+
+if importlib.util.find_spec("PyQt6"):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+
+
+@unittest.skipUnless(importlib.util.find_spec("PyQt6"), "PyQt6 not installed")
+class TestUploadPreviewDialog(unittest.TestCase):
+    """The reused preview dialog must only show the current file's chunks."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the QApplication the dialog needs."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def _preview(self, chunk_durations):
+        """Build a preview for a file split into the given chunks."""
+        from audio_processor import AudioFilePreview
+        return AudioFilePreview(
+            file_path="/tmp/test.wav",
+            file_name="test.wav",
+            file_size_mb=30.0,
+            duration_seconds=sum(chunk_durations),
+            sample_rate=16000,
+            channels=1,
+            needs_splitting=len(chunk_durations) > 1,
+            estimated_chunks=len(chunk_durations),
+            chunk_durations=chunk_durations,
+        )
+
+    def _chunk_rows(self, dialog):
+        """Get the chunk rows currently in the dialog's list, in order."""
+        from ui_qt.dialogs.upload_preview_dialog import ChunkPreviewItem
+        layout = dialog._chunk_layout
+        rows = (layout.itemAt(i).widget() for i in range(layout.count()))
+        return [row for row in rows if isinstance(row, ChunkPreviewItem)]
+
+    def test_reset_replaces_chunk_rows(self):
+        """Test that reopening the dialog for another file leaves no stale rows."""
+        from ui_qt.dialogs.upload_preview_dialog import UploadPreviewDialog
+        dialog = UploadPreviewDialog(self._preview([600.0, 600.0, 600.0]))
+        self.assertEqual(len(self._chunk_rows(dialog)), 3)
+
+        # No event loop runs between resets, as with the nested exec()
+        dialog.reset(self._preview([600.0, 300.0]))
+        rows = self._chunk_rows(dialog)
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows, dialog._chunk_items)
+
+        dialog.reset(self._preview([120.0]))
+        self.assertEqual(self._chunk_rows(dialog), [])
+        dialog.deleteLater()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,10 +2,7 @@
 PyQt6 UI package for OpenWhisper.
 Modern, professional interface with clean design.
 """
-from ui_qt.app import QtApplication
-from ui_qt.main_window_qt import ModernMainWindow
-from ui_qt.loading_screen_qt import ModernLoadingScreen
-from ui_qt.overlay_qt import ModernWaveformOverlay
+import importlib
 
 __all__ = [
     "QtApplication",
@@ -13,3 +10,19 @@ __all__ = [
     "ModernLoadingScreen",
     "ModernWaveformOverlay",
 ]
+
+_LAZY_EXPORTS = {
+    "QtApplication": "ui_qt.app",
+    "ModernMainWindow": "ui_qt.main_window_qt",
+    "ModernLoadingScreen": "ui_qt.loading_screen_qt",
+    "ModernWaveformOverlay": "ui_qt.overlay_qt",
+}
+
+
+def __getattr__(name):
+    # Submodules are imported on first access so that importing one window
+    # does not drag in every other window (and its dependencies).
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
@@ -1,12 +1,29 @@
 """
 Dialog windows for PyQt6 UI.
+
+Dialogs are imported on first access so loading one dialog module does not
+build the others.
 """
-from ui_qt.dialogs.settings_dialog import SettingsDialog
-from ui_qt.dialogs.hotkey_dialog import HotkeyDialog
-from ui_qt.dialogs.upload_preview_dialog import UploadPreviewDialog
+import importlib
+
+_DIALOG_MODULES = {
+    "SettingsDialog": "ui_qt.dialogs.settings_dialog",
+    "HotkeyDialog": "ui_qt.dialogs.hotkey_dialog",
+    "UploadPreviewDialog": "ui_qt.dialogs.upload_preview_dialog",
+}
 
 __all__ = [
     "SettingsDialog",
     "HotkeyDialog",
     "UploadPreviewDialog",
 ]
+
+
+def __getattr__(name):
+    """Import a dialog class on first access."""
+    module_name = _DIALOG_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
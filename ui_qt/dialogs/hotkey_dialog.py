@@ -2,17 +2,18 @@
 Modern Hotkey Configuration Dialog for PyQt6 UI.
 """
 import logging
-import keyboard
+from functools import partial
 from typing import Optional, Callable, Dict
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QPushButton, QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QThread
-from PyQt6.QtGui import QFont, QKeySequence, QMouseEvent
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtGui import QFont, QKeySequence, QKeyEvent, QMouseEvent
 
 from config import config
 from ui_qt.widgets import PrimaryButton, ModernButton, HeaderCard
+from ui_qt.utils.fonts import get_font
 
 
 class ClickableLineEdit(QLineEdit):
@@ -25,21 +26,62 @@ class ClickableLineEdit(QLineEdit):
         super().mousePressEvent(event)
 
 
-class HotkeyCaptureThread(QThread):
-    """Thread to capture a single hotkey without blocking UI."""
-    captured = pyqtSignal(str)
-
-    def run(self):
-        """Run the capture."""
-        try:
-            # read_hotkey blocks until a hotkey is pressed
-            # suppress=False to let the key event pass through if needed,
-            # but here we probably want to consume it or just read it.
-            # Using suppress=True might block other apps, but for configuration it's okay.
-            hotkey = keyboard.read_hotkey(suppress=False)
-            self.captured.emit(hotkey)
-        except Exception as e:
-            logging.error(f"Error capturing hotkey: {e}")
+# Modifier keys are only recorded as part of a combination
+MODIFIER_KEYS = frozenset({
+    Qt.Key.Key_Control, Qt.Key.Key_Shift, Qt.Key.Key_Alt, Qt.Key.Key_Meta,
+    Qt.Key.Key_AltGr,
+})
+
+# Qt key names that differ from the names used by the keyboard library
+KEY_NAMES = {
+    Qt.Key.Key_Escape: "esc",
+    Qt.Key.Key_Return: "enter",
+    Qt.Key.Key_Enter: "enter",
+    Qt.Key.Key_Plus: "plus",
+    Qt.Key.Key_PageUp: "page up",
+    Qt.Key.Key_PageDown: "page down",
+    Qt.Key.Key_CapsLock: "caps lock",
+    Qt.Key.Key_NumLock: "num lock",
+    Qt.Key.Key_ScrollLock: "scroll lock",
+    Qt.Key.Key_Print: "print screen",
+    Qt.Key.Key_Delete: "delete",
+    Qt.Key.Key_Insert: "insert",
+    # Qt reports Shift+Tab as Backtab; the shift is already in the modifiers
+    Qt.Key.Key_Backtab: "tab",
+}
+
+
+def _set_capturing(input_field: QLineEdit, capturing: bool):
+    """Toggle the capturing look of a hotkey input (see theme.qss)."""
+    input_field.setProperty("capturing", capturing)
+    input_field.style().unpolish(input_field)
+    input_field.style().polish(input_field)
+
+
+def hotkey_from_key_event(event: QKeyEvent) -> str:
+    """Convert a Qt key event into a hotkey string for the keyboard library.
+
+    Args:
+        event: Key press event of a non-modifier key.
+
+    Returns:
+        Hotkey string such as "ctrl+alt+*".
+    """
+    parts = []
+    modifiers = event.modifiers()
+    if modifiers & Qt.KeyboardModifier.ControlModifier:
+        parts.append("ctrl")
+    if modifiers & Qt.KeyboardModifier.AltModifier:
+        parts.append("alt")
+    if modifiers & Qt.KeyboardModifier.ShiftModifier:
+        parts.append("shift")
+    if modifiers & Qt.KeyboardModifier.MetaModifier:
+        parts.append("windows")
+
+    key = event.key()
+    name = KEY_NAMES.get(key) or QKeySequence(key).toString().lower() or event.text()
+    parts.append(name)
+    return "+".join(parts)
 
 
 class HotkeyDialog(QDialog):
@@ -47,6 +89,16 @@ class HotkeyDialog(QDialog):
 
     hotkeys_changed = pyqtSignal(dict)
 
+    # (label, hotkey type, input attribute) for each configurable hotkey
+    _ROWS = (
+        ("Record Toggle:", "record_toggle", "record_input"),
+        ("Cancel Recording:", "cancel", "cancel_input"),
+        ("Enable/Disable:", "enable_disable", "enable_input"),
+    )
+
+    # Settings manager imported on first use (False if unavailable)
+    _settings_manager = None
+
     def __init__(self, parent=None):
         """Initialize hotkey dialog."""
         super().__init__(parent)
@@ -57,7 +109,8 @@ class HotkeyDialog(QDialog):
         # State
         self.current_hotkeys: Dict[str, str] = {}
         self.capturing = None
-        self.capture_thread: Optional[HotkeyCaptureThread] = None
+        self.current_input_field: Optional[ClickableLineEdit] = None
+        self._inputs: Dict[str, ClickableLineEdit] = {}
 
         # Callbacks
         self.on_hotkeys_save: Optional[Callable] = None
@@ -67,16 +120,18 @@ class HotkeyDialog(QDialog):
 
     def _setup_ui(self):
         """Setup the user interface."""
+        title_font = get_font(14, QFont.Weight.Bold)
+        label_font = get_font(11)
+        text_font = get_font(10)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(16)
 
         # Header
         title = QLabel("Hotkey Configuration")
-        title_font = QFont("Segoe UI", 14)
-        title_font.setBold(True)
         title.setFont(title_font)
-        title.setStyleSheet("color: #e0e0ff;")
+        title.setProperty("role", "setting")
         layout.addWidget(title)
 
         # Instructions
@@ -84,45 +139,24 @@ class HotkeyDialog(QDialog):
             "Click on a field to record a new hotkey.\n"
             "Press the desired key combination."
         )
-        instructions.setStyleSheet("color: #a0a0c0;")
-        instructions.setFont(QFont("Segoe UI", 10))
+        instructions.setProperty("role", "info")
+        instructions.setFont(text_font)
         layout.addWidget(instructions)
 
-        layout.addSpacing(12)
-
-        # Record toggle hotkey
-        record_label = QLabel("Record Toggle:")
-        record_label.setStyleSheet("color: #e0e0ff;")
-        record_label.setFont(QFont("Segoe UI", 11))
-        layout.addWidget(record_label)
-
-        self.record_input = self._create_hotkey_input()
-        self.record_input.clicked.connect(lambda: self._start_capture("record_toggle", self.record_input))
-        layout.addWidget(self.record_input)
-
-        layout.addSpacing(12)
-
-        # Cancel hotkey
-        cancel_label = QLabel("Cancel Recording:")
-        cancel_label.setStyleSheet("color: #e0e0ff;")
-        cancel_label.setFont(QFont("Segoe UI", 11))
-        layout.addWidget(cancel_label)
-
-        self.cancel_input = self._create_hotkey_input()
-        self.cancel_input.clicked.connect(lambda: self._start_capture("cancel", self.cancel_input))
-        layout.addWidget(self.cancel_input)
-
-        layout.addSpacing(12)
+        # Hotkey rows: spacing, label, input field
+        for text, hotkey_type, attr in self._ROWS:
+            layout.addSpacing(12)
 
-        # Enable/Disable hotkey
-        enable_label = QLabel("Enable/Disable:")
-        enable_label.setStyleSheet("color: #e0e0ff;")
-        enable_label.setFont(QFont("Segoe UI", 11))
-        layout.addWidget(enable_label)
+            label = QLabel(text)
+            label.setProperty("role", "setting")
+            label.setFont(label_font)
+            layout.addWidget(label)
 
-        self.enable_input = self._create_hotkey_input()
-        self.enable_input.clicked.connect(lambda: self._start_capture("enable_disable", self.enable_input))
-        layout.addWidget(self.enable_input)
+            input_field = self._create_hotkey_input()
+            input_field.clicked.connect(partial(self._start_capture, hotkey_type, input_field))
+            setattr(self, attr, input_field)
+            self._inputs[hotkey_type] = input_field
+            layout.addWidget(input_field)
 
         layout.addSpacing(16)
 
@@ -150,72 +184,44 @@ class HotkeyDialog(QDialog):
 
         layout.addLayout(button_layout)
 
-        # Apply styling
-        self.setStyleSheet("""
-            HotkeyDialog {
-                background-color: #1e1e2e;
-                border-radius: 8px;
-            }
-        """)
-
     def _create_hotkey_input(self) -> ClickableLineEdit:
         """Create a hotkey input field."""
         input_field = ClickableLineEdit()
         input_field.setReadOnly(True)
         input_field.setMinimumHeight(36)
-        input_field.setFont(QFont("Segoe UI", 10))
+        input_field.setFont(get_font(10))
         input_field.setPlaceholderText("Click to set hotkey")
-        input_field.setStyleSheet("""
-            QLineEdit {
-                background-color: #2d2d44;
-                color: #00d4ff;
-                border: 1px solid #404060;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-weight: bold;
-            }
-            QLineEdit:focus {
-                border: 2px solid #00d4ff;
-            }
-        """)
-        # Store original style for reset
-        input_field.setProperty("original_style", input_field.styleSheet())
         return input_field
 
     def _start_capture(self, hotkey_type: str, input_field: ClickableLineEdit):
         """Start capturing a hotkey."""
-        try:
-            # If already capturing, stop previous capture
-            if self.capture_thread and self.capture_thread.isRunning():
-                self.capture_thread.terminate()
-                self.capture_thread.wait(1000)  # Wait with timeout
-                self._reset_input_styles()
-
-            self.capturing = hotkey_type
-            self.current_input_field = input_field
-            
-            input_field.setText("Press keys...")
-            input_field.setStyleSheet("""
-                QLineEdit {
-                    background-color: #6366f1;
-                    color: #ffffff;
-                    border: 2px solid #00d4ff;
-                    border-radius: 6px;
-                    padding: 6px 12px;
-                    font-weight: bold;
-                }
-            """)
-
-            self.logger.info(f"Capturing hotkey for: {hotkey_type}")
-            
-            # Start capture thread
-            self.capture_thread = HotkeyCaptureThread()
-            self.capture_thread.captured.connect(self._on_hotkey_captured)
-            self.capture_thread.start()
-        except Exception as e:
-            self.logger.error(f"Failed to start hotkey capture: {e}")
-            self._reset_input_styles()
-            self.capturing = None
+        # If already capturing, stop previous capture
+        self._stop_capture()
+
+        self.capturing = hotkey_type
+        self.current_input_field = input_field
+
+        input_field.setText("Press keys...")
+        _set_capturing(input_field, True)
+
+        # Route all key presses to keyPressEvent until a hotkey is captured
+        input_field.setFocus(Qt.FocusReason.MouseFocusReason)
+        self.grabKeyboard()
+
+        self.logger.info(f"Capturing hotkey for: {hotkey_type}")
+
+    def keyPressEvent(self, event: QKeyEvent):
+        """Capture the pressed key combination while a field is recording."""
+        if not self.capturing:
+            super().keyPressEvent(event)
+            return
+
+        event.accept()
+        if event.isAutoRepeat() or event.key() in MODIFIER_KEYS:
+            # Wait for the first press of the combination's non-modifier key
+            return
+
+        self._on_hotkey_captured(hotkey_from_key_event(event))
 
     def _on_hotkey_captured(self, hotkey: str):
         """Handle captured hotkey."""
@@ -224,33 +230,26 @@ class HotkeyDialog(QDialog):
 
         self.logger.info(f"Captured hotkey: {hotkey}")
         
-        # Update state
+        # Update state; stopping the capture shows the new hotkey in the field
         self.current_hotkeys[self.capturing] = hotkey
-        self.current_input_field.setText(hotkey)
-        
-        # Reset UI
+        self._stop_capture()
+
+    def _stop_capture(self):
+        """Stop an in-progress capture, restoring the field's previous hotkey."""
+        if not self.capturing:
+            return
+
+        self.releaseKeyboard()
+        if self.current_input_field:
+            self.current_input_field.setText(self.current_hotkeys.get(self.capturing, ""))
         self._reset_input_styles()
         self.capturing = None
         self.current_input_field = None
 
     def _reset_input_styles(self):
-        """Reset all input fields to default style."""
-        style = """
-            QLineEdit {
-                background-color: #2d2d44;
-                color: #00d4ff;
-                border: 1px solid #404060;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-weight: bold;
-            }
-            QLineEdit:focus {
-                border: 2px solid #00d4ff;
-            }
-        """
-        self.record_input.setStyleSheet(style)
-        self.cancel_input.setStyleSheet(style)
-        self.enable_input.setStyleSheet(style)
+        """Reset the capturing input field to the default style."""
+        if self.current_input_field:
+            _set_capturing(self.current_input_field, False)
 
     def _reset_to_defaults(self):
         """Reset hotkeys to default values."""
@@ -258,48 +257,61 @@ class HotkeyDialog(QDialog):
         self._update_displays()
         self.logger.info("Hotkeys reset to defaults")
 
+    def reload_hotkeys(self):
+        """Reload saved hotkeys before the dialog is shown again.
+
+        Discards unsaved edits from a previous open.
+        """
+        self._load_hotkeys()
+
     def _load_hotkeys(self):
         """Load current hotkey settings."""
         self.current_hotkeys = config.DEFAULT_HOTKEYS.copy()
-        # Load from settings if available (passed via parent or config)
-        # For now we use defaults as base, but in real app we should load from settings_manager
-        # However, the dialog is initialized with defaults. 
-        # Ideally we should pass current hotkeys to __init__ or load them here.
-        # Let's try to load from settings_manager if possible, or rely on what's passed.
-        # Since we don't have direct access to settings_manager here (to avoid circular imports if any),
-        # we'll rely on the fact that we are setting them.
-        # Actually, let's import settings_manager to be safe.
-        try:
-            from settings import settings_manager
-            saved_hotkeys = settings_manager.load_hotkey_settings()
-            self.current_hotkeys.update(saved_hotkeys)
-        except ImportError:
-            pass
-            
+        settings_manager = self._get_settings_manager()
+        if settings_manager:
+            self.current_hotkeys.update(settings_manager.load_hotkey_settings())
+
         self._update_displays()
 
+    @classmethod
+    def _get_settings_manager(cls):
+        """Get the settings manager, importing it only once per process.
+
+        Returns:
+            The settings manager, or None if it is unavailable.
+        """
+        if cls._settings_manager is None:
+            try:
+                from settings import settings_manager
+                cls._settings_manager = settings_manager
+            except ImportError:
+                cls._settings_manager = False
+        return cls._settings_manager or None
+
     def _update_displays(self):
         """Update the input field displays."""
-        self.record_input.setText(self.current_hotkeys.get("record_toggle", "*"))
-        self.cancel_input.setText(self.current_hotkeys.get("cancel", "-"))
-        self.enable_input.setText(self.current_hotkeys.get("enable_disable", "ctrl+alt+*"))
+        for hotkey_type, input_field in self._inputs.items():
+            input_field.setText(self.current_hotkeys.get(hotkey_type, config.DEFAULT_HOTKEYS[hotkey_type]))
 
     def _save_hotkeys(self):
         """Save hotkey settings."""
-        if self.on_hotkeys_save:
-            self.on_hotkeys_save(self.current_hotkeys)
+        hotkeys = dict(self.current_hotkeys)
+        self.hotkeys_changed.emit(hotkeys)
+        self.accept()
 
-        self.hotkeys_changed.emit(self.current_hotkeys)
+        # Persist once the dialog is closed so key events queued during the
+        # disk write can't reach it. The callback updates widgets and hotkey
+        # hooks, so it runs on the GUI thread rather than in a worker.
+        if self.on_hotkeys_save:
+            QTimer.singleShot(0, partial(self.on_hotkeys_save, hotkeys))
         self.logger.info("Hotkeys saved")
-        self.accept()
+
+    def done(self, result: int):
+        """Release the keyboard grab when the dialog is accepted or rejected."""
+        self._stop_capture()
+        super().done(result)
 
     def closeEvent(self, event):
         """Handle close event."""
-        try:
-            if self.capture_thread and self.capture_thread.isRunning():
-                self.capture_thread.terminate()
-                self.capture_thread.wait(1000)  # Wait with timeout
-        except Exception as e:
-            self.logger.debug(f"Error stopping capture thread: {e}")
-        finally:
-            super().closeEvent(event)
+        self._stop_capture()
+        super().closeEvent(event)
@@ -3,18 +3,61 @@ Modern Settings Dialog for PyQt6 UI.
 Tabbed interface for managing application settings.
 """
 import logging
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, Any, List
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget,
     QWidget, QLabel, QComboBox, QCheckBox, QSpinBox,
     QSlider, QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QSignalBlocker, QStringListModel, QTimer
 from PyQt6.QtGui import QFont
 
 from config import config
 from settings import settings_manager
 from ui_qt.widgets import PrimaryButton, ModernButton
+from ui_qt.utils.fonts import get_font
+
+# Read-only combo box models shared by every dialog, keyed by their entries
+_COMBO_MODELS: Dict[tuple, QStringListModel] = {}
+
+
+def _combo_model(items: List[str]) -> QStringListModel:
+    """Get the shared list model for a set of combo box entries.
+
+    Args:
+        items: Entries of the combo box.
+
+    Returns:
+        A model holding the entries, created on first request.
+    """
+    key = tuple(items)
+    model = _COMBO_MODELS.get(key)
+    if model is None:
+        model = _COMBO_MODELS[key] = QStringListModel(list(key))
+    return model
+
+
+class SettingsLoaderThread(QThread):
+    """Thread to read the settings file without blocking the dialog's first paint."""
+    loaded = pyqtSignal(dict)
+
+    def __init__(self, parent=None):
+        """Initialize the loader thread."""
+        super().__init__(parent)
+        # Result of the last run, readable once the thread has finished
+        self.settings: Dict[str, Any] = {}
+
+    def run(self):
+        """Read all settings and emit them."""
+        try:
+            settings = settings_manager.load_all_settings()
+            logging.getLogger(__name__).info("Settings loaded successfully")
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Failed to load settings: {e}")
+            # Use defaults on error
+            settings = {}
+        self.settings = settings
+        self.loaded.emit(settings)
 
 
 class SettingsDialog(QDialog):
@@ -22,6 +65,10 @@ class SettingsDialog(QDialog):
 
     settings_changed = pyqtSignal(dict)
 
+    # Tab indices; tab contents are built the first time a tab is shown
+    GENERAL_TAB, AUDIO_TAB, HOTKEYS_TAB, ADVANCED_TAB = range(4)
+    _TAB_TITLES = ("General", "Audio", "Hotkeys", "Advanced")
+
     def __init__(self, parent=None):
         """Initialize settings dialog."""
         super().__init__(parent)
@@ -33,6 +80,14 @@ class SettingsDialog(QDialog):
         # Callbacks
         self.on_settings_save: Optional[Callable] = None
 
+        # Settings read from disk, applied to each tab once it is built
+        self._loaded_settings: Dict[str, Any] = {}
+        self._settings_applied = False
+
+        # Background settings reader, restarted by each _load_settings call
+        self._loader = SettingsLoaderThread(self)
+        self._loader.loaded.connect(self._apply_loaded_settings)
+
         self._setup_ui()
         self._load_settings()
 
@@ -44,30 +99,19 @@ class SettingsDialog(QDialog):
 
         # Tab widget
         self.tabs = QTabWidget()
-        self.tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #404060;
-                background-color: #1e1e2e;
-            }
-            QTabBar::tab {
-                background-color: #2d2d44;
-                color: #a0a0c0;
-                border: none;
-                padding: 10px 20px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                            stop:0 #6366f1, stop:1 #8b5cf6);
-                color: #ffffff;
-            }
-        """)
-
-        # Create tabs
-        self._create_general_tab()
-        self._create_audio_tab()
-        self._create_hotkeys_tab()
-        self._create_advanced_tab()
+
+        # Create empty tab pages; contents are built on first selection
+        self._tab_builders = (
+            self._create_general_tab,
+            self._create_audio_tab,
+            self._create_hotkeys_tab,
+            self._create_advanced_tab,
+        )
+        self._tab_built = [False] * len(self._tab_builders)
+        for title in self._TAB_TITLES:
+            self.tabs.addTab(QWidget(), title)
+        self._ensure_tab_built(self.GENERAL_TAB)
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
 
         layout.addWidget(self.tabs)
 
@@ -88,101 +132,113 @@ class SettingsDialog(QDialog):
 
         layout.addLayout(button_layout)
 
-        # Apply background
-        self.setStyleSheet("""
-            SettingsDialog {
-                background-color: #1e1e2e;
-                border-radius: 8px;
-            }
-        """)
-
-    def _create_general_tab(self):
-        """Create general settings tab."""
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
+    def _new_tab_layout(self, title_text: str) -> QVBoxLayout:
+        """Create a detached tab layout that starts with a title.
+
+        The layout is installed on the tab only once it is fully populated,
+        so the widgets are parented and laid out in a single pass.
+
+        Args:
+            title_text: Text of the tab title.
+
+        Returns:
+            The new layout.
+        """
+        layout = QVBoxLayout()
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(16)
 
-        # Title
-        title = QLabel("General Settings")
-        title_font = QFont("Segoe UI", 12)
-        title_font.setBold(True)
-        title.setFont(title_font)
-        title.setStyleSheet("color: #e0e0ff;")
+        title = QLabel(title_text)
+        title.setFont(get_font(12, QFont.Weight.Bold))
+        title.setProperty("role", "setting")
         layout.addWidget(title)
+        return layout
+
+    @staticmethod
+    def _add_setting_row(layout: QVBoxLayout, label_text: str, widget: QWidget,
+                         spacing: int = 12):
+        """Add a labelled setting widget to a tab layout.
+
+        Args:
+            layout: Tab layout to add to.
+            label_text: Text of the label shown above the widget.
+            widget: Setting widget.
+            spacing: Extra space before the label; 0 for none.
+        """
+        if spacing:
+            layout.addSpacing(spacing)
+        label = QLabel(label_text)
+        label.setProperty("role", "setting")
+        layout.addWidget(label)
+        layout.addWidget(widget)
+
+    @staticmethod
+    def _new_combo(items: List[str]) -> QComboBox:
+        """Create a settings combo box.
+
+        Args:
+            items: Entries of the combo box.
+
+        Returns:
+            The new combo box.
+        """
+        combo = QComboBox()
+        combo.setModel(_combo_model(items))
+        combo.setMinimumHeight(36)
+        return combo
+
+    def _create_general_tab(self, tab: QWidget):
+        """Create general settings tab.
+
+        Args:
+            tab: Empty tab page to fill.
+        """
+        layout = self._new_tab_layout("General Settings")
 
         # Model selection
-        layout.addSpacing(12)
-        model_label = QLabel("Default Model:")
-        model_label.setStyleSheet("color: #e0e0ff;")
-        layout.addWidget(model_label)
-
-        self.model_combo = QComboBox()
-        self.model_combo.addItems(config.MODEL_CHOICES)
-        self.model_combo.setMinimumHeight(36)
-        layout.addWidget(self.model_combo)
+        self.model_combo = self._new_combo(config.MODEL_CHOICES)
+        self._add_setting_row(layout, "Default Model:", self.model_combo)
 
         # Auto-paste checkbox
         layout.addSpacing(12)
         self.auto_paste_check = QCheckBox("Auto-paste transcription to active window")
-        self.auto_paste_check.setStyleSheet("color: #e0e0ff;")
+        self.auto_paste_check.setProperty("role", "setting")
         layout.addWidget(self.auto_paste_check)
 
         # Copy to clipboard checkbox
         self.copy_clipboard_check = QCheckBox("Copy transcription to clipboard")
-        self.copy_clipboard_check.setStyleSheet("color: #e0e0ff;")
+        self.copy_clipboard_check.setProperty("role", "setting")
         layout.addWidget(self.copy_clipboard_check)
 
         # Minimize to tray checkbox
         layout.addSpacing(12)
         self.minimize_tray_check = QCheckBox("Minimize to system tray on close")
-        self.minimize_tray_check.setStyleSheet("color: #e0e0ff;")
+        self.minimize_tray_check.setProperty("role", "setting")
         layout.addWidget(self.minimize_tray_check)
 
         layout.addStretch()
-        self.tabs.addTab(tab, "General")
+        tab.setLayout(layout)
 
-    def _create_audio_tab(self):
-        """Create audio settings tab."""
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        layout.setContentsMargins(24, 24, 24, 24)
-        layout.setSpacing(16)
+    def _create_audio_tab(self, tab: QWidget):
+        """Create audio settings tab.
 
-        # Title
-        title = QLabel("Audio Settings")
-        title_font = QFont("Segoe UI", 12)
-        title_font.setBold(True)
-        title.setFont(title_font)
-        title.setStyleSheet("color: #e0e0ff;")
-        layout.addWidget(title)
+        Args:
+            tab: Empty tab page to fill.
+        """
+        layout = self._new_tab_layout("Audio Settings")
 
         # Sample rate
-        layout.addSpacing(12)
-        sample_rate_label = QLabel("Sample Rate (Hz):")
-        sample_rate_label.setStyleSheet("color: #e0e0ff;")
-        layout.addWidget(sample_rate_label)
-
-        self.sample_rate_combo = QComboBox()
-        self.sample_rate_combo.addItems(["16000", "22050", "44100", "48000"])
-        self.sample_rate_combo.setMinimumHeight(36)
-        layout.addWidget(self.sample_rate_combo)
+        self.sample_rate_combo = self._new_combo(["16000", "22050", "44100", "48000"])
+        self._add_setting_row(layout, "Sample Rate (Hz):", self.sample_rate_combo)
 
         # Channels
-        layout.addSpacing(12)
-        channels_label = QLabel("Channels:")
-        channels_label.setStyleSheet("color: #e0e0ff;")
-        layout.addWidget(channels_label)
-
-        self.channels_combo = QComboBox()
-        self.channels_combo.addItems(["Mono (1)", "Stereo (2)"])
-        self.channels_combo.setMinimumHeight(36)
-        layout.addWidget(self.channels_combo)
+        self.channels_combo = self._new_combo(["Mono (1)", "Stereo (2)"])
+        self._add_setting_row(layout, "Channels:", self.channels_combo)
 
         # Silence threshold
         layout.addSpacing(12)
         threshold_label = QLabel("Silence Threshold:")
-        threshold_label.setStyleSheet("color: #e0e0ff;")
+        threshold_label.setProperty("role", "setting")
         layout.addWidget(threshold_label)
 
         threshold_layout = QHBoxLayout()
@@ -192,9 +248,15 @@ class SettingsDialog(QDialog):
         self.threshold_slider.setValue(10)
 
         self.threshold_value_label = QLabel("0.01")
-        self.threshold_value_label.setStyleSheet("color: #00d4ff; font-weight: bold;")
+        self.threshold_value_label.setProperty("role", "value")
         self.threshold_value_label.setMaximumWidth(50)
 
+        # Slider drags update the label at most once per frame
+        self._threshold_pending = self.threshold_slider.value()
+        self._threshold_timer = QTimer(self)
+        self._threshold_timer.setSingleShot(True)
+        self._threshold_timer.setInterval(16)
+        self._threshold_timer.timeout.connect(self._apply_threshold)
         self.threshold_slider.valueChanged.connect(self._update_threshold_display)
 
         threshold_layout.addWidget(self.threshold_slider)
@@ -202,26 +264,19 @@ class SettingsDialog(QDialog):
         layout.addLayout(threshold_layout)
 
         layout.addStretch()
-        self.tabs.addTab(tab, "Audio")
+        tab.setLayout(layout)
 
-    def _create_hotkeys_tab(self):
-        """Create hotkeys settings tab."""
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        layout.setContentsMargins(24, 24, 24, 24)
-        layout.setSpacing(16)
+    def _create_hotkeys_tab(self, tab: QWidget):
+        """Create hotkeys settings tab.
 
-        # Title
-        title = QLabel("Hotkeys")
-        title_font = QFont("Segoe UI", 12)
-        title_font.setBold(True)
-        title.setFont(title_font)
-        title.setStyleSheet("color: #e0e0ff;")
-        layout.addWidget(title)
+        Args:
+            tab: Empty tab page to fill.
+        """
+        layout = self._new_tab_layout("Hotkeys")
 
         layout.addSpacing(12)
         info_label = QLabel("Configure global hotkeys for quick access")
-        info_label.setStyleSheet("color: #a0a0c0; font-style: italic;")
+        info_label.setProperty("role", "info")
         layout.addWidget(info_label)
 
         layout.addSpacing(16)
@@ -231,98 +286,83 @@ class SettingsDialog(QDialog):
         layout.addWidget(hotkey_button)
 
         layout.addStretch()
-        self.tabs.addTab(tab, "Hotkeys")
+        tab.setLayout(layout)
 
-    def _create_advanced_tab(self):
-        """Create advanced settings tab."""
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        layout.setContentsMargins(24, 24, 24, 24)
-        layout.setSpacing(16)
+    def _create_advanced_tab(self, tab: QWidget):
+        """Create advanced settings tab.
 
-        # Title
-        title = QLabel("Advanced Settings")
-        title_font = QFont("Segoe UI", 12)
-        title_font.setBold(True)
-        title.setFont(title_font)
-        title.setStyleSheet("color: #e0e0ff;")
-        layout.addWidget(title)
+        Args:
+            tab: Empty tab page to fill.
+        """
+        layout = self._new_tab_layout("Advanced Settings")
 
         # Whisper Engine Settings section
         layout.addSpacing(12)
         whisper_title = QLabel("Whisper Engine")
-        whisper_title.setStyleSheet("color: #a0a0c0; font-weight: bold;")
+        whisper_title.setProperty("role", "section")
         layout.addWidget(whisper_title)
 
-        # Whisper Model selection
-        model_label = QLabel("Model:")
-        model_label.setStyleSheet("color: #e0e0ff;")
-        layout.addWidget(model_label)
-
-        self.whisper_model_combo = QComboBox()
-        self.whisper_model_combo.addItems(config.WHISPER_MODEL_CHOICES)
-        self.whisper_model_combo.setMinimumHeight(36)
-        layout.addWidget(self.whisper_model_combo)
-
-        # Device selection
-        layout.addSpacing(8)
-        device_label = QLabel("Device:")
-        device_label.setStyleSheet("color: #e0e0ff;")
-        layout.addWidget(device_label)
-
-        self.whisper_device_combo = QComboBox()
-        self.whisper_device_combo.addItems(["auto", "cuda", "cpu"])
-        self.whisper_device_combo.setMinimumHeight(36)
-        layout.addWidget(self.whisper_device_combo)
-
-        # Compute type selection
-        layout.addSpacing(8)
-        compute_label = QLabel("Compute Type:")
-        compute_label.setStyleSheet("color: #e0e0ff;")
-        layout.addWidget(compute_label)
-
-        self.whisper_compute_combo = QComboBox()
-        self.whisper_compute_combo.addItems(["auto", "float16", "float32", "int8"])
-        self.whisper_compute_combo.setMinimumHeight(36)
-        layout.addWidget(self.whisper_compute_combo)
+        # Whisper model, device and compute type selection
+        self.whisper_model_combo = self._new_combo(config.WHISPER_MODEL_CHOICES)
+        self._add_setting_row(layout, "Model:", self.whisper_model_combo, spacing=0)
+
+        self.whisper_device_combo = self._new_combo(["auto", "cuda", "cpu"])
+        self._add_setting_row(layout, "Device:", self.whisper_device_combo, spacing=8)
+
+        self.whisper_compute_combo = self._new_combo(["auto", "float16", "float32", "int8"])
+        self._add_setting_row(layout, "Compute Type:", self.whisper_compute_combo, spacing=8)
 
         # Info label
         compute_info = QLabel("Changes require restarting the whisper engine")
-        compute_info.setStyleSheet("color: #808090; font-size: 10px; font-style: italic;")
+        compute_info.setProperty("role", "note")
         layout.addWidget(compute_info)
 
         # Separator
         layout.addSpacing(16)
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
-        separator.setStyleSheet("background-color: #404060;")
+        separator.setProperty("role", "separator")
         layout.addWidget(separator)
 
         # Max file size
-        layout.addSpacing(12)
-        max_size_label = QLabel("Maximum File Size (MB):")
-        max_size_label.setStyleSheet("color: #e0e0ff;")
-        layout.addWidget(max_size_label)
-
         self.max_size_spinbox = QSpinBox()
         self.max_size_spinbox.setMinimum(1)
         self.max_size_spinbox.setMaximum(500)
         self.max_size_spinbox.setValue(23)
         self.max_size_spinbox.setMinimumHeight(36)
-        layout.addWidget(self.max_size_spinbox)
+        self._add_setting_row(layout, "Maximum File Size (MB):", self.max_size_spinbox)
 
         # Enable logging checkbox
         layout.addSpacing(12)
         self.logging_check = QCheckBox("Enable detailed logging")
-        self.logging_check.setStyleSheet("color: #e0e0ff;")
+        self.logging_check.setProperty("role", "setting")
         layout.addWidget(self.logging_check)
 
         layout.addStretch()
-        self.tabs.addTab(tab, "Advanced")
+        tab.setLayout(layout)
+
+    def _ensure_tab_built(self, index: int):
+        """Build a tab's contents the first time it is selected.
+
+        Args:
+            index: Index of the tab page.
+        """
+        if index < 0 or self._tab_built[index]:
+            return
+
+        self._tab_built[index] = True
+        self._tab_builders[index](self.tabs.widget(index))
+        self._apply_tab_settings(index)
 
     def _update_threshold_display(self, value):
-        """Update threshold value display."""
-        threshold = value / 1000.0
+        """Schedule a threshold value display update."""
+        self._threshold_pending = value
+        if not self._threshold_timer.isActive():
+            self._threshold_timer.start()
+
+    def _apply_threshold(self):
+        """Show the latest threshold value."""
+        threshold = self._threshold_pending / 1000.0
         self.threshold_value_label.setText(f"{threshold:.3f}")
 
     def _open_hotkey_dialog(self):
@@ -333,26 +373,63 @@ class SettingsDialog(QDialog):
         dialog = HotkeyDialog(self)
         dialog.exec()
 
-    def _load_settings(self):
-        """Load settings from configuration."""
-        try:
-            settings = settings_manager.load_all_settings()
+    def reload_settings(self):
+        """Reload saved settings before the dialog is shown again.
+
+        Discards unsaved edits from a previous open.
+        """
+        self.tabs.setCurrentIndex(self.GENERAL_TAB)
+        self._load_settings()
 
+    def _load_settings(self):
+        """Load settings from configuration in the background.
+
+        Widgets show their defaults until the loaded values arrive.
+        """
+        self._settings_applied = False
+        self._loader.wait()
+        self._loader.start()
+
+    def _apply_loaded_settings(self, settings: Dict[str, Any]):
+        """Store loaded settings and apply them to every built tab.
+
+        Args:
+            settings: Settings read from disk.
+        """
+        # Saving may already have applied this load ahead of the signal
+        if self._settings_applied:
+            return
+        self._settings_applied = True
+        self._loaded_settings = settings
+        for index, built in enumerate(self._tab_built):
+            if built:
+                self._apply_tab_settings(index)
+
+    def _apply_tab_settings(self, index: int):
+        """Apply loaded settings to the widgets of a built tab.
+
+        Args:
+            index: Index of the tab page.
+        """
+        settings = self._loaded_settings
+
+        if index == self.GENERAL_TAB:
             # Load model selection
             saved_model = settings.get('selected_model', 'local_whisper')
-            # Find display name for saved model
-            for display_name, internal_value in config.MODEL_VALUE_MAP.items():
-                if internal_value == saved_model:
-                    index = self.model_combo.findText(display_name)
-                    if index >= 0:
-                        self.model_combo.setCurrentIndex(index)
-                    break
+            display_name = config.MODEL_DISPLAY_MAP.get(saved_model)
+            if display_name:
+                with QSignalBlocker(self.model_combo):
+                    self.model_combo.setCurrentText(display_name)
 
             # Load checkboxes
-            self.auto_paste_check.setChecked(settings.get('auto_paste', True))
-            self.copy_clipboard_check.setChecked(settings.get('copy_clipboard', True))
-            self.minimize_tray_check.setChecked(settings.get('minimize_tray', True))
-
+            with QSignalBlocker(self.auto_paste_check), \
+                    QSignalBlocker(self.copy_clipboard_check), \
+                    QSignalBlocker(self.minimize_tray_check):
+                self.auto_paste_check.setChecked(settings.get('auto_paste', True))
+                self.copy_clipboard_check.setChecked(settings.get('copy_clipboard', True))
+                self.minimize_tray_check.setChecked(settings.get('minimize_tray', True))
+
+        elif index == self.ADVANCED_TAB:
             # Load whisper engine settings
             whisper_model = settings.get('whisper_model', config.DEFAULT_WHISPER_MODEL)
             whisper_device = settings.get('whisper_device', 'auto')
@@ -370,31 +447,37 @@ class SettingsDialog(QDialog):
             if compute_index >= 0:
                 self.whisper_compute_combo.setCurrentIndex(compute_index)
 
-            self.logger.info("Settings loaded successfully")
-        except Exception as e:
-            self.logger.error(f"Failed to load settings: {e}")
-            # Use defaults on error
-            self.auto_paste_check.setChecked(True)
-            self.copy_clipboard_check.setChecked(True)
-            self.minimize_tray_check.setChecked(True)
+    def done(self, result: int):
+        """Make sure the settings loader has finished before the dialog closes."""
+        self._loader.wait()
+        super().done(result)
 
     def _save_settings(self):
         """Save settings and close dialog."""
         try:
+            # Start from the settings loaded when the dialog opened. The
+            # loaded signal may still be queued, in which case the widgets
+            # still hold their defaults; apply the loader's result first so
+            # those defaults are not saved over the stored values.
+            self._loader.wait()
+            self._apply_loaded_settings(self._loader.settings)
+            settings = dict(self._loader.settings)
+
             # Get current display name and convert to internal value
             model_display = self.model_combo.currentText()
             model_internal = config.MODEL_VALUE_MAP.get(model_display, 'local_whisper')
 
-            # Load existing settings
-            settings = settings_manager.load_all_settings()
-
             # Check if whisper engine settings changed
             old_whisper_model = settings.get('whisper_model', config.DEFAULT_WHISPER_MODEL)
             old_device = settings.get('whisper_device', 'auto')
             old_compute = settings.get('whisper_compute_type', 'auto')
-            new_whisper_model = self.whisper_model_combo.currentText()
-            new_device = self.whisper_device_combo.currentText()
-            new_compute = self.whisper_compute_combo.currentText()
+            if self._tab_built[self.ADVANCED_TAB]:
+                new_whisper_model = self.whisper_model_combo.currentText()
+                new_device = self.whisper_device_combo.currentText()
+                new_compute = self.whisper_compute_combo.currentText()
+            else:
+                # Advanced tab never opened, keep the saved engine settings
+                new_whisper_model, new_device, new_compute = old_whisper_model, old_device, old_compute
             whisper_settings_changed = (
                 old_whisper_model != new_whisper_model or
                 old_device != new_device or
@@ -412,6 +495,7 @@ class SettingsDialog(QDialog):
 
             # Save to file
             settings_manager.save_all_settings(settings)
+            self._loader.settings = self._loaded_settings = dict(settings)
 
             self.logger.info("Settings saved successfully")
 
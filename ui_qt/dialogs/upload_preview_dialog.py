@@ -91,6 +91,16 @@ class UploadPreviewDialog(QDialog):
         self.on_proceed: Optional[Callable] = None
         
         self._setup_ui()
+        self._apply_preview()
+
+    def reset(self, preview: AudioFilePreview):
+        """Show a new file preview in the existing dialog.
+
+        Args:
+            preview: AudioFilePreview object with file analysis.
+        """
+        self.preview = preview
+        self._apply_preview()
     
     def _setup_ui(self):
         """Setup the user interface."""
@@ -122,82 +132,77 @@ class UploadPreviewDialog(QDialog):
         info_layout.setSpacing(10)
         
         # File name
-        filename_label = QLabel(f"File: {self.preview.file_name}")
-        filename_label.setStyleSheet("color: #00d4ff; font-size: 13px; font-weight: bold;")
-        filename_label.setWordWrap(True)
-        info_layout.addWidget(filename_label)
+        self._filename_label = QLabel()
+        self._filename_label.setStyleSheet("color: #00d4ff; font-size: 13px; font-weight: bold;")
+        self._filename_label.setWordWrap(True)
+        info_layout.addWidget(self._filename_label)
         
         # File size
-        size_label = QLabel(f"Size: {self.preview.file_size_formatted}")
-        size_label.setStyleSheet("color: #e0e0ff; font-size: 12px;")
-        info_layout.addWidget(size_label)
+        self._size_label = QLabel()
+        self._size_label.setStyleSheet("color: #e0e0ff; font-size: 12px;")
+        info_layout.addWidget(self._size_label)
         
         # Duration
-        duration_label = QLabel(f"Duration: {self.preview.duration_formatted}")
-        duration_label.setStyleSheet("color: #e0e0ff; font-size: 12px;")
-        info_layout.addWidget(duration_label)
+        self._duration_label = QLabel()
+        self._duration_label.setStyleSheet("color: #e0e0ff; font-size: 12px;")
+        info_layout.addWidget(self._duration_label)
         
         # Sample rate and channels
-        audio_info = QLabel(f"Audio: {self.preview.sample_rate} Hz, {'Stereo' if self.preview.channels == 2 else 'Mono'}")
-        audio_info.setStyleSheet("color: #a0a0c0; font-size: 11px;")
-        info_layout.addWidget(audio_info)
+        self._audio_info = QLabel()
+        self._audio_info.setStyleSheet("color: #a0a0c0; font-size: 11px;")
+        info_layout.addWidget(self._audio_info)
         
         layout.addWidget(info_card)
         
-        # Chunking info section
-        if self.preview.needs_splitting:
-            chunk_header = QLabel(f"Will be split into {self.preview.estimated_chunks} chunks")
-            chunk_header.setStyleSheet("color: #fbbf24; font-size: 13px; font-weight: bold;")
-            chunk_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(chunk_header)
-            
-            explanation = QLabel("Large files are split at silence points for optimal transcription")
-            explanation.setStyleSheet("color: #a0a0c0; font-size: 11px; font-style: italic;")
-            explanation.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            explanation.setWordWrap(True)
-            layout.addWidget(explanation)
-            
-            # Chunk list in scrollable area
-            scroll = QScrollArea()
-            scroll.setWidgetResizable(True)
-            scroll.setMaximumHeight(180)
-            scroll.setStyleSheet("""
-                QScrollArea {
-                    background-color: transparent;
-                    border: none;
-                }
-                QScrollBar:vertical {
-                    background-color: #1e1e2e;
-                    width: 8px;
-                    border-radius: 4px;
-                }
-                QScrollBar::handle:vertical {
-                    background-color: #404060;
-                    border-radius: 4px;
-                }
-                QScrollBar::handle:vertical:hover {
-                    background-color: #6366f1;
-                }
-            """)
-            
-            chunk_container = QWidget()
-            chunk_layout = QVBoxLayout(chunk_container)
-            chunk_layout.setContentsMargins(0, 0, 0, 0)
-            chunk_layout.setSpacing(4)
-            
-            for i, duration in enumerate(self.preview.chunk_durations):
-                chunk_item = ChunkPreviewItem(i + 1, duration)
-                chunk_layout.addWidget(chunk_item)
-            
-            chunk_layout.addStretch()
-            scroll.setWidget(chunk_container)
-            layout.addWidget(scroll)
-        else:
-            # Single chunk message
-            single_label = QLabel("File will be transcribed in one pass")
-            single_label.setStyleSheet("color: #34d399; font-size: 13px; font-weight: bold;")
-            single_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(single_label)
+        # Chunking info section; shown for files that need splitting
+        self._chunk_header = QLabel()
+        self._chunk_header.setStyleSheet("color: #fbbf24; font-size: 13px; font-weight: bold;")
+        self._chunk_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self._chunk_header)
+        
+        self._explanation = QLabel("Large files are split at silence points for optimal transcription")
+        self._explanation.setStyleSheet("color: #a0a0c0; font-size: 11px; font-style: italic;")
+        self._explanation.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._explanation.setWordWrap(True)
+        layout.addWidget(self._explanation)
+        
+        # Chunk list in scrollable area
+        self._chunk_scroll = QScrollArea()
+        self._chunk_scroll.setWidgetResizable(True)
+        self._chunk_scroll.setMaximumHeight(180)
+        self._chunk_scroll.setStyleSheet("""
+            QScrollArea {
+                background-color: transparent;
+                border: none;
+            }
+            QScrollBar:vertical {
+                background-color: #1e1e2e;
+                width: 8px;
+                border-radius: 4px;
+            }
+            QScrollBar::handle:vertical {
+                background-color: #404060;
+                border-radius: 4px;
+            }
+            QScrollBar::handle:vertical:hover {
+                background-color: #6366f1;
+            }
+        """)
+        
+        chunk_container = QWidget()
+        self._chunk_layout = QVBoxLayout(chunk_container)
+        self._chunk_layout.setContentsMargins(0, 0, 0, 0)
+        self._chunk_layout.setSpacing(4)
+        self._chunk_layout.addStretch()
+        self._chunk_items = []
+        self._chunk_scroll.setWidget(chunk_container)
+        layout.addWidget(self._chunk_scroll)
+        
+        # Single chunk message; shown for files transcribed in one pass
+        self._single_label = QLabel("File will be transcribed in one pass")
+        self._single_label.setStyleSheet("color: #34d399; font-size: 13px; font-weight: bold;")
+        self._single_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self._single_label)
         
         layout.addStretch()
         
@@ -225,6 +230,37 @@ class UploadPreviewDialog(QDialog):
             }
         """)
     
+    def _apply_preview(self):
+        """Fill the dialog from the current preview."""
+        preview = self.preview
+        self._filename_label.setText(f"File: {preview.file_name}")
+        self._size_label.setText(f"Size: {preview.file_size_formatted}")
+        self._duration_label.setText(f"Duration: {preview.duration_formatted}")
+        self._audio_info.setText(f"Audio: {preview.sample_rate} Hz, {'Stereo' if preview.channels == 2 else 'Mono'}")
+
+        # Replace the chunk list; it differs per file
+        for chunk_item in self._chunk_items:
+            # deleteLater alone leaves the row laid out until the event loop runs
+            self._chunk_layout.removeWidget(chunk_item)
+            chunk_item.hide()
+            chunk_item.deleteLater()
+        self._chunk_items = []
+
+        needs_splitting = preview.needs_splitting
+        if needs_splitting:
+            self._chunk_header.setText(f"Will be split into {preview.estimated_chunks} chunks")
+            # Insert items ahead of the trailing stretch
+            for i, duration in enumerate(preview.chunk_durations):
+                chunk_item = ChunkPreviewItem(i + 1, duration)
+                self._chunk_layout.insertWidget(i, chunk_item)
+                self._chunk_items.append(chunk_item)
+            self._chunk_scroll.verticalScrollBar().setValue(0)
+
+        self._chunk_header.setVisible(needs_splitting)
+        self._explanation.setVisible(needs_splitting)
+        self._chunk_scroll.setVisible(needs_splitting)
+        self._single_label.setVisible(not needs_splitting)
+    
     def _on_proceed(self):
         """Handle proceed button click."""
         self.logger.info(f"Proceeding with transcription: {self.preview.file_path}")
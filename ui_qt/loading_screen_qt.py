@@ -4,13 +4,16 @@ Unified, custom-painted loading screen with static display for fast startup.
 """
 import logging
 import math
-from PyQt6.QtWidgets import QWidget, QApplication
+from typing import Optional
+from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import Qt, QRectF, pyqtSignal
 from PyQt6.QtGui import (
     QPainter, QPainterPath, QColor, QFont, QBrush, QPen,
-    QLinearGradient, QRadialGradient
+    QLinearGradient, QRadialGradient, QPixmap, QGuiApplication
 )
 
+from ui_qt.utils.fonts import get_font
+
 
 class ModernLoadingScreen(QWidget):
     """
@@ -20,6 +23,11 @@ class ModernLoadingScreen(QWidget):
 
     # Signal to notify loading completion
     finished = pyqtSignal()
+    # Emitted when the screen is clicked
+    clicked = pyqtSignal()
+
+    INITIAL_STATUS = "Initializing..."
+    INITIAL_PROGRESS = "Please wait..."
 
     def __init__(self):
         """Initialize loading screen."""
@@ -37,15 +45,8 @@ class ModernLoadingScreen(QWidget):
         # Size
         self.setFixedSize(450, 300)
 
-        # Center on screen
-        screen = QApplication.primaryScreen().geometry()
-        self.move(
-            screen.center().x() - self.width() // 2,
-            screen.center().y() - self.height() // 2
-        )
-
-        self.status_text = "Initializing..."
-        self.progress_text = "Please wait..."
+        self.status_text = self.INITIAL_STATUS
+        self.progress_text = self.INITIAL_PROGRESS
 
         # Colors
         self.bg_color = QColor("#0f172a")  # Slate 900
@@ -53,9 +54,17 @@ class ModernLoadingScreen(QWidget):
         self.text_color = QColor("#e2e8f0")  # Slate 200
         self.subtext_color = QColor("#94a3b8")  # Slate 400
 
-    def paintEvent(self, event):
-        """Paint the custom loading screen."""
-        painter = QPainter(self)
+        # Pre-rendered background and emblem, built on first paint
+        self._static_layer: Optional[QPixmap] = None
+
+    def _render_static_layer(self) -> QPixmap:
+        """Pre-render the background and emblem, which never change between paints."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         rect = self.rect()
@@ -109,21 +118,35 @@ class ModernLoadingScreen(QWidget):
         painter.drawRoundedRect(mic_rect, 8, 8)
         painter.drawLine(int(center_x), int(center_y + 12), int(center_x), int(center_y + 18))
         painter.drawLine(int(center_x - 8), int(center_y + 18), int(center_x + 8), int(center_y + 18))
+        painter.end()
+        return pixmap
 
+    def paintEvent(self, event):
+        """Paint the custom loading screen."""
+        if self._static_layer is None:
+            self._static_layer = self._render_static_layer()
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # 1-2. Background and central display from the cached layer
+        painter.drawPixmap(0, 0, self._static_layer)
+
+        w, h = self.width(), self.height()
         # 3. Text
         # Title
         painter.setPen(self.text_color)
-        painter.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        painter.setFont(get_font(16, QFont.Weight.Bold))
         painter.drawText(QRectF(0, h - 90, w, 30), Qt.AlignmentFlag.AlignCenter, "OpenWhisper")
         
         # Status
         painter.setPen(self.accent_color)
-        painter.setFont(QFont("Segoe UI", 10, QFont.Weight.DemiBold))
+        painter.setFont(get_font(10, QFont.Weight.DemiBold))
         painter.drawText(QRectF(0, h - 55, w, 20), Qt.AlignmentFlag.AlignCenter, self.status_text)
         
         # Progress/Details
         painter.setPen(self.subtext_color)
-        painter.setFont(QFont("Segoe UI", 9))
+        painter.setFont(get_font(9))
         painter.drawText(QRectF(0, h - 35, w, 20), Qt.AlignmentFlag.AlignCenter, self.progress_text)
 
     def update_status(self, status_text: str):
@@ -136,6 +159,31 @@ class ModernLoadingScreen(QWidget):
         self.progress_text = progress_text
         self.update()
 
+    def reset(self):
+        """Restore the initial status and progress messages."""
+        self.status_text = self.INITIAL_STATUS
+        self.progress_text = self.INITIAL_PROGRESS
+        self.update()
+
+    def mousePressEvent(self, event):
+        """Report clicks so the owner can dismiss the screen."""
+        self.clicked.emit()
+        super().mousePressEvent(event)
+
+    def showEvent(self, event):
+        """Center on the primary screen once the window geometry is final."""
+        screen = QGuiApplication.primaryScreen()
+        if screen is not None:
+            frame = self.frameGeometry()
+            frame.moveCenter(screen.availableGeometry().center())
+            self.move(frame.topLeft())
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        """Release the cached static layer while hidden; it is rebuilt on the next paint."""
+        self._static_layer = None
+        super().hideEvent(event)
+
     def closeEvent(self, event):
         """Handle closing."""
         event.accept()
@@ -3,23 +3,22 @@ Modern PyQt6 Main Window.
 Main application window with recording controls and transcription display.
 """
 import logging
-from typing import Optional, Callable
+from typing import Optional, Callable, List, Dict
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QComboBox, QTextEdit, QFrame, QPushButton
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QLabel, QComboBox, QPlainTextEdit, QMenu
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QFont, QIcon, QPixmap
+from PyQt6.QtCore import Qt, QTimer, QSignalBlocker, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QAction, QGuiApplication
 
 from config import config
 from settings import settings_manager
-from ui_qt.loading_screen_qt import ModernLoadingScreen
 from ui_qt.widgets import (
     HeaderCard, Card, PrimaryButton, DangerButton,
-    SuccessButton, ControlPanel, ModernButton,
+    SuccessButton, ControlPanel,
     HistorySidebar, HistoryEdgeTab
 )
-from history_manager import history_manager
+from ui_qt.utils.fonts import get_font
 
 
 class ModernMainWindow(QMainWindow):
@@ -50,8 +49,27 @@ class ModernMainWindow(QMainWindow):
         # State
         self.is_recording = False
         self.current_model = config.MODEL_CHOICES[0]
-        self.test_loading_screen_instance = None  # Keep reference to prevent GC
+        self._loading_screen = None  # Reused by test_loading_screen, created on first use
         self._force_quit = False  # Flag to bypass minimize to tray on close
+        self._minimize_tray = True  # Read from settings in _load_saved_settings
+        self._clipboard = QGuiApplication.clipboard()  # Application-wide, fetch once
+
+        # Restores the idle status after a temporary message
+        self._status_reset_timer = QTimer(self)
+        self._status_reset_timer.setSingleShot(True)
+        self._status_reset_timer.timeout.connect(self._reset_status)
+
+        # Settles a burst of model combo changes (e.g. arrow-key browsing)
+        # into one model switch
+        self._applied_model = self.current_model
+        self._model_change_timer = QTimer(self)
+        self._model_change_timer.setSingleShot(True)
+        self._model_change_timer.timeout.connect(self._apply_model_change)
+
+        # Menu actions, kept so they live as long as the window
+        self._menu_actions: List[QAction] = []
+        # Top-level menus not yet opened, mapped to the method that fills them
+        self._menu_builders: Dict[QMenu, Callable[[QMenu], None]] = {}
         
         # Window sizing for sidebar toggle
         self._base_width = 580  # Optimal width without sidebar
@@ -66,11 +84,12 @@ class ModernMainWindow(QMainWindow):
         self.on_retranscribe: Optional[Callable] = None
         self.on_show_copied_animation: Optional[Callable] = None
 
-        # Setup UI
+        # Setup UI; the menu bar is filled once the event loop is running so
+        # the window can be shown first
         self._setup_ui()
-        self._setup_menu()
         self._connect_signals()
         self._load_saved_settings()
+        QTimer.singleShot(0, self._setup_menu)
 
     def _setup_ui(self):
         """Setup the user interface."""
@@ -82,12 +101,6 @@ class ModernMainWindow(QMainWindow):
         root_layout.setContentsMargins(0, 0, 0, 0)
         root_layout.setSpacing(0)
 
-        # Main content area (left side)
-        main_area = QWidget()
-        main_area_layout = QVBoxLayout(main_area)
-        main_area_layout.setContentsMargins(0, 0, 0, 0)
-        main_area_layout.setSpacing(0)
-
         # Content Container (Centered)
         content_container = QWidget()
         content_container.setObjectName("contentContainer")
@@ -96,7 +109,7 @@ class ModernMainWindow(QMainWindow):
         content_layout.setSpacing(16) # Reduced spacing for compactness
         content_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)
 
-        # Wrapper to center the content container horizontally
+        # Main content area (left side): centers the content container horizontally
         center_wrapper = QHBoxLayout()
         center_wrapper.addStretch()
         center_wrapper.addWidget(content_container, stretch=1)
@@ -106,28 +119,26 @@ class ModernMainWindow(QMainWindow):
         content_container.setMaximumWidth(700) # Slightly narrower for cleaner look
         content_container.setMinimumWidth(500)
 
-        main_area_layout.addLayout(center_wrapper)
-
         # Model selection card
         model_card = Card()
         # Layout margins handled by Card class
 
         model_label = QLabel("Transcription Model")
         model_label.setObjectName("headerLabel")
-        model_label.setFont(QFont("Segoe UI", 13)) # Adjusted font size
+        model_label.setFont(get_font(13)) # Adjusted font size
         model_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self.model_combo = QComboBox()
         self.model_combo.addItems(config.MODEL_CHOICES)
+        self._model_indexes = {name: i for i, name in enumerate(config.MODEL_CHOICES)}
         self.model_combo.setMinimumHeight(40) # Slightly reduced height
-        self.model_combo.setFont(QFont("Segoe UI", 12))
+        self.model_combo.setFont(get_font(12))
 
         # Device info label (shows CUDA/CPU status)
         self.device_info_label = QLabel("")
         self.device_info_label.setObjectName("deviceInfoLabel")
         self.device_info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.device_info_label.setFont(QFont("Segoe UI", 10))
-        self.device_info_label.setStyleSheet("color: #8888aa; margin-top: 4px;")
+        self.device_info_label.setFont(get_font(10))
         self.device_info_label.hide()  # Hidden until device info is set
 
         model_card.layout.addWidget(model_label)
@@ -140,7 +151,7 @@ class ModernMainWindow(QMainWindow):
         self.status_label = QLabel("Ready to record")
         self.status_label.setObjectName("statusLabel")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setFont(QFont("Segoe UI", 13))
+        self.status_label.setFont(get_font(13))
         content_layout.addWidget(self.status_label)
 
         # Control buttons
@@ -164,10 +175,10 @@ class ModernMainWindow(QMainWindow):
         # Transcription display card
         transcription_card = HeaderCard("Transcription")
 
-        self.transcription_text = QTextEdit()
+        self.transcription_text = QPlainTextEdit()
         self.transcription_text.setReadOnly(True)
         self.transcription_text.setMinimumHeight(250) # Adjusted height
-        self.transcription_text.setFont(QFont("Segoe UI", 13))
+        self.transcription_text.setFont(get_font(13))
         self.transcription_text.setPlaceholderText(
             "Transcription will appear here...\n"
             "Start recording to begin."
@@ -177,112 +188,189 @@ class ModernMainWindow(QMainWindow):
 
         content_layout.addWidget(transcription_card)
         
-        content_layout.addWidget(transcription_card)
-        
         content_layout.addStretch() # Push everything up
 
         # Add main area to root layout
-        root_layout.addWidget(main_area, stretch=1)
+        root_layout.addLayout(center_wrapper, stretch=1)
+
+        # History widgets signal on the GUI thread; direct connections skip
+        # the per-emit thread check
+        direct = Qt.ConnectionType.DirectConnection
 
         # History edge tab (always visible toggle button)
         self.history_edge_tab = HistoryEdgeTab()
-        self.history_edge_tab.clicked.connect(self.toggle_history)
+        self.history_edge_tab.clicked.connect(self.toggle_history, direct)
         root_layout.addWidget(self.history_edge_tab)
 
         # History sidebar (right side)
         self.history_sidebar = HistorySidebar()
-        self.history_sidebar.entry_selected.connect(self._on_history_entry_selected)
-        self.history_sidebar.entry_copied.connect(self._on_history_entry_copied)
-        self.history_sidebar.entry_deleted.connect(self._on_history_entry_deleted)
-        self.history_sidebar.retranscribe_requested.connect(self._on_retranscribe_requested)
+        self.history_sidebar.entry_selected.connect(self._on_history_entry_selected, direct)
+        self.history_sidebar.entry_copied.connect(self._on_history_entry_copied, direct)
+        self.history_sidebar.entry_deleted.connect(self._on_history_entry_deleted, direct)
+        self.history_sidebar.retranscribe_requested.connect(self._on_retranscribe_requested, direct)
         root_layout.addWidget(self.history_sidebar)
 
     def _setup_menu(self):
-        """Setup the menu bar."""
+        """Setup the menu bar.
+
+        Only the top-level menus are created here; each one is filled in
+        the first time it is opened.
+        """
         menubar = self.menuBar()
-        menubar.setStyleSheet("""
-            QMenuBar {
-                background-color: #2d2d44;
-                color: #e0e0ff;
-                border-bottom: 1px solid #404060;
-            }
-            QMenuBar::item:selected {
-                background-color: #6366f1;
-            }
-            QMenu {
-                background-color: #2d2d44;
-                color: #e0e0ff;
-            }
-            QMenu::item:selected {
-                background-color: #6366f1;
-            }
-        """)
-
-        # File menu
-        file_menu = menubar.addMenu("File")
-        file_menu.addAction("Upload Audio File...", self.upload_audio_file)
-        file_menu.addSeparator()
-        file_menu.addAction("Settings", self.open_settings)
-        file_menu.addAction("Hotkeys", self.open_hotkey_settings)
-        file_menu.addSeparator()
-        file_menu.addAction("Minimize to Tray", self.minimize_to_tray)
-        file_menu.addAction("Exit", self.quit_application)
-
-        # View menu
-        view_menu = menubar.addMenu("View")
-        view_menu.addAction("History", self.toggle_history)
-        view_menu.addSeparator()
-        view_menu.addAction("Show Overlay", self.toggle_overlay)
-        view_menu.addAction("Show Loading Screen", self.test_loading_screen)
-        view_menu.addSeparator()
-
-        # Test Overlays submenu
+        self._menu_builders = {
+            menubar.addMenu("File"): self._build_file_menu,
+            menubar.addMenu("View"): self._build_view_menu,
+            menubar.addMenu("Help"): self._build_help_menu,
+        }
+        for menu in self._menu_builders:
+            menu.aboutToShow.connect(self._on_menu_about_to_show)
+
+    @pyqtSlot()
+    def _on_menu_about_to_show(self):
+        """Populate a top-level menu on its first open."""
+        menu = self.sender()
+        build = self._menu_builders.pop(menu, None)
+        if build is not None:
+            menu.aboutToShow.disconnect(self._on_menu_about_to_show)
+            build(menu)
+
+    def _build_file_menu(self, file_menu: QMenu):
+        """Fill in the File menu."""
+        file_menu.addActions(self._create_actions([
+            ("Upload Audio File...", self.upload_audio_file),
+            None,
+            ("Settings", self.open_settings),
+            ("Hotkeys", self.open_hotkey_settings),
+            None,
+            ("Minimize to Tray", self.minimize_to_tray),
+            ("Exit", self.quit_application),
+        ]))
+
+    def _build_view_menu(self, view_menu: QMenu):
+        """Fill in the View menu."""
+        view_menu.addActions(self._create_actions([
+            ("History", self.toggle_history),
+            None,
+            ("Show Overlay", self.toggle_overlay),
+            ("Show Loading Screen", self.test_loading_screen),
+            None,
+        ]))
+
+        # Test Overlays submenu; each action carries its overlay state
         test_overlays_menu = view_menu.addMenu("Test Overlays")
-        test_overlays_menu.addAction("Recording", lambda: self.test_overlay("recording"))
-        test_overlays_menu.addAction("Processing", lambda: self.test_overlay("processing"))
-        test_overlays_menu.addAction("Transcribing", lambda: self.test_overlay("transcribing"))
-        test_overlays_menu.addAction("Canceling", lambda: self.test_overlay("canceling"))
-        test_overlays_menu.addSeparator()
-        test_overlays_menu.addAction("STT Enable", lambda: self.test_overlay("stt_enable"))
-        test_overlays_menu.addAction("STT Disable", lambda: self.test_overlay("stt_disable"))
-        test_overlays_menu.addAction("Copied", lambda: self.test_overlay("copied"))
-        test_overlays_menu.addSeparator()
-        test_overlays_menu.addAction("Large File Splitting (Amber)", lambda: self.test_overlay("large_file_splitting"))
-        test_overlays_menu.addAction("Large File Processing (Cyan)", lambda: self.test_overlay("large_file_processing"))
-
-        # Help menu
-        help_menu = menubar.addMenu("Help")
-        help_menu.addAction("About", self.show_about)
+        test_overlays_menu.addActions(self._create_actions([
+            ("Recording", "recording"),
+            ("Processing", "processing"),
+            ("Transcribing", "transcribing"),
+            ("Canceling", "canceling"),
+            None,
+            ("STT Enable", "stt_enable"),
+            ("STT Disable", "stt_disable"),
+            ("Copied", "copied"),
+            None,
+            ("Large File Splitting (Amber)", "large_file_splitting"),
+            ("Large File Processing (Cyan)", "large_file_processing"),
+        ]))
+        test_overlays_menu.triggered.connect(self._on_test_overlay_action)
+
+    def _build_help_menu(self, help_menu: QMenu):
+        """Fill in the Help menu."""
+        help_menu.addActions(self._create_actions([
+            ("About", self.show_about),
+        ]))
+
+    def _create_actions(self, entries: list) -> List[QAction]:
+        """Create menu actions in one batch.
+
+        Args:
+            entries: (text, target) pairs, or None for a separator. A callable
+                target is connected to the action; anything else is stored
+                as the action's data.
+
+        Returns:
+            The created actions, in order.
+        """
+        actions = []
+        for entry in entries:
+            action = QAction(self)
+            if entry is None:
+                action.setSeparator(True)
+            else:
+                text, target = entry
+                action.setText(text)
+                if callable(target):
+                    action.triggered.connect(target)
+                else:
+                    action.setData(target)
+            actions.append(action)
+        self._menu_actions.extend(actions)
+        return actions
+
+    @pyqtSlot(QAction)
+    def _on_test_overlay_action(self, action: QAction):
+        """Handle an action from the Test Overlays submenu."""
+        self.test_overlay(action.data())
 
     def _connect_signals(self):
-        """Connect button signals to slots."""
-        self.record_button.clicked.connect(self._on_record_clicked)
-        self.stop_button.clicked.connect(self._on_stop_clicked)
-        self.cancel_button.clicked.connect(self._on_cancel_clicked)
-        self.model_combo.currentTextChanged.connect(self._on_model_changed)
+        """Connect button signals to slots.
+
+        Senders and receivers all live on the GUI thread, so the connections
+        are direct and skip the per-emit thread check of AutoConnection.
+        """
+        direct = Qt.ConnectionType.DirectConnection
+        self.record_button.clicked.connect(self._on_record_clicked, direct)
+        self.stop_button.clicked.connect(self._on_stop_clicked, direct)
+        self.cancel_button.clicked.connect(self._on_cancel_clicked, direct)
+        self.model_combo.currentTextChanged.connect(self._on_model_changed, direct)
 
     def _load_saved_settings(self):
-        """Load saved settings and apply to UI."""
+        """Load saved settings and apply to UI.
+
+        The settings file is read once here; the values the window needs
+        later are cached so interactive paths never touch the disk.
+        """
         try:
-            # Load the saved model selection
-            saved_model = settings_manager.load_model_selection()
-            
-            # Find the display name for the saved model
-            for display_name, internal_value in config.MODEL_VALUE_MAP.items():
-                if internal_value == saved_model:
-                    index = self.model_combo.findText(display_name)
-                    if index >= 0:
-                        # Block signals temporarily to avoid triggering on_model_changed
-                        self.model_combo.blockSignals(True)
-                        self.model_combo.setCurrentIndex(index)
-                        self.current_model = display_name
-                        self.model_combo.blockSignals(False)
-                        self.logger.info(f"Loaded saved model selection: {display_name}")
-                    break
+            settings = settings_manager.load_all_settings()
         except Exception as e:
             self.logger.error(f"Failed to load saved settings: {e}")
-            # Use default (already set)
+            return  # Use defaults (already set)
+
+        # Find the display name for the saved model; unknown values keep the default
+        display_name = config.MODEL_DISPLAY_MAP.get(settings.get('selected_model'))
+        if display_name and self._set_current_model(display_name):
+            self.logger.info(f"Loaded saved model selection: {display_name}")
+
+        # Cached so closing the window never reads the settings file
+        self._minimize_tray = settings.get('minimize_tray', True)  # Default to True
+
+    def set_minimize_to_tray(self, enabled: bool):
+        """Set whether closing the window hides it to the system tray.
+
+        Args:
+            enabled: True to hide to the tray on close.
+        """
+        self._minimize_tray = enabled
 
+    def _set_current_model(self, display_name: str) -> bool:
+        """Select a model in the combo without emitting change signals.
+
+        Args:
+            display_name: Display name of the model to select.
+
+        Returns:
+            True if the model was found and selected.
+        """
+        index = self._model_indexes.get(display_name)
+        if index is None:
+            return False
+        with QSignalBlocker(self.model_combo):
+            self.model_combo.setCurrentIndex(index)
+        self._model_change_timer.stop()
+        self.current_model = display_name
+        self._applied_model = display_name
+        return True
+
+    @pyqtSlot()
     def _on_record_clicked(self):
         """Handle record button click."""
         self.is_recording = True
@@ -293,6 +381,7 @@ class ModernMainWindow(QMainWindow):
 
         self.record_toggled.emit(True)
 
+    @pyqtSlot()
     def _on_stop_clicked(self):
         """Handle stop button click."""
         self.is_recording = False
@@ -303,6 +392,7 @@ class ModernMainWindow(QMainWindow):
 
         self.record_toggled.emit(False)
 
+    @pyqtSlot()
     def _on_cancel_clicked(self):
         """Handle cancel button click."""
         self.is_recording = False
@@ -311,34 +401,79 @@ class ModernMainWindow(QMainWindow):
         if self.on_record_cancel:
             self.on_record_cancel()
 
+    @pyqtSlot(str)
     def _on_model_changed(self, model_name: str):
-        """Handle model selection change."""
+        """Handle model selection change.
+
+        The selection takes effect immediately for get_model_value; the
+        model switch itself is announced once the selection settles.
+        """
+        # Programmatic re-selection of the same model must not trigger a reload
+        if model_name == self.current_model:
+            return
         self.current_model = model_name
+        self._model_change_timer.start(150)
+
+    @pyqtSlot()
+    def _apply_model_change(self):
+        """Announce the settled model selection, if it changed."""
+        self._model_change_timer.stop()
+        model_name = self.current_model
+        if model_name == self._applied_model:
+            return
+        self._applied_model = model_name
         if self.on_model_changed:
             self.on_model_changed(model_name)
         self.model_changed.emit(model_name)
 
     def _update_recording_state(self):
         """Update button states based on recording status."""
-        if self.is_recording:
-            self.record_button.setEnabled(False)
-            self.record_button.setText("Recording...")
-            self.stop_button.setEnabled(True)
-            self.cancel_button.setEnabled(True)
-            self.model_combo.setEnabled(False)
-            self.status_label.setText("Recording in progress...")
-        else:
-            self.record_button.setEnabled(True)
-            self.record_button.setText("Start Recording")
-            self.stop_button.setEnabled(False)
-            self.cancel_button.setEnabled(False)
-            self.model_combo.setEnabled(True)
-            self.status_label.setText("Ready to record")
+        # Coalesce the widget changes below into a single repaint;
+        # re-enabling updates schedules it.
+        if self.is_recording and self._model_change_timer.isActive():
+            # The combo locks while recording, so a pending selection is final
+            self._apply_model_change()
+
+        central = self.centralWidget()
+        central.setUpdatesEnabled(False)
+        try:
+            if self.is_recording:
+                self.record_button.setEnabled(False)
+                self.record_button.setText("Recording...")
+                self.stop_button.setEnabled(True)
+                self.cancel_button.setEnabled(True)
+                self.model_combo.setEnabled(False)
+                self.status_label.setText("Recording in progress...")
+            else:
+                self.record_button.setEnabled(True)
+                self.record_button.setText("Start Recording")
+                self.stop_button.setEnabled(False)
+                self.cancel_button.setEnabled(False)
+                self.model_combo.setEnabled(True)
+                self.status_label.setText("Ready to record")
+        finally:
+            central.setUpdatesEnabled(True)
 
     def set_status(self, status_text: str):
         """Update the status label."""
+        self._status_reset_timer.stop()
         self.status_label.setText(status_text)
 
+    def _flash_status(self, status_text: str, duration_ms: int = 2000):
+        """Show a temporary status, then return to the idle status.
+
+        Args:
+            status_text: Status to show.
+            duration_ms: How long to show it; a newer message restarts the wait.
+        """
+        self.set_status(status_text)
+        self._status_reset_timer.start(duration_ms)
+
+    @pyqtSlot()
+    def _reset_status(self):
+        """Return to the idle status."""
+        self.status_label.setText("Ready to record")
+
     def set_device_info(self, device_info: str):
         """Set the device info label (e.g., 'cuda (float16)').
 
@@ -353,7 +488,7 @@ class ModernMainWindow(QMainWindow):
 
     def set_transcription(self, text: str):
         """Set the transcription text."""
-        self.transcription_text.setText(text)
+        self.transcription_text.setPlainText(text)
 
     def append_transcription(self, text: str):
         """Append text to the transcription."""
@@ -370,21 +505,25 @@ class ModernMainWindow(QMainWindow):
         """Get the model value key."""
         return config.MODEL_VALUE_MAP.get(self.current_model, "local_whisper")
 
+    @pyqtSlot()
     def open_settings(self):
         """Open settings dialog."""
         self.logger.info("Opening settings dialog")
         self.settings_requested.emit()
 
+    @pyqtSlot()
     def open_hotkey_settings(self):
         """Open hotkey settings dialog."""
         self.logger.info("Opening hotkey settings")
         self.hotkeys_requested.emit()
 
+    @pyqtSlot()
     def upload_audio_file(self):
         """Request to upload an audio file for transcription."""
         self.logger.info("Upload audio file requested")
         self.upload_audio_requested.emit()
 
+    @pyqtSlot()
     def toggle_overlay(self):
         """Toggle the overlay visibility."""
         self.logger.info("Toggling overlay")
@@ -395,51 +534,79 @@ class ModernMainWindow(QMainWindow):
         self.logger.info(f"Testing overlay state: {state}")
         self.test_overlay_requested.emit(state)
 
+    # Simulated activity for the loading screen test: (time in ms, method, text).
+    # A None method hides the screen.
+    _LOADING_TEST_STEPS = (
+        (1000, "update_status", "Loading resources..."),
+        (2000, "update_progress", "Connecting to services..."),
+        (3000, "update_status", "Almost ready..."),
+        (5000, None, None),
+    )
+
+    def _get_loading_screen(self):
+        """Get the test loading screen, creating it on first use."""
+        if self._loading_screen is None:
+            from ui_qt.loading_screen_qt import ModernLoadingScreen
+            self._loading_screen = ModernLoadingScreen()
+            # Allow click to close
+            self._loading_screen.clicked.connect(self._hide_loading_screen)
+
+            self._loading_test_step = 0
+            self._loading_test_timer = QTimer(self)
+            self._loading_test_timer.setSingleShot(True)
+            self._loading_test_timer.timeout.connect(self._advance_loading_test)
+        return self._loading_screen
+
+    @pyqtSlot()
     def test_loading_screen(self):
         """Show the loading screen for testing purposes."""
         self.logger.info("Testing loading screen")
-        
-        if self.test_loading_screen_instance:
-            self.test_loading_screen_instance.destroy()
-            self.test_loading_screen_instance = None
-            
-        self.test_loading_screen_instance = ModernLoadingScreen()
-        self.test_loading_screen_instance.show()
-        
-        # Simulate some activity
-        QTimer.singleShot(1000, lambda: self.test_loading_screen_instance.update_status("Loading resources..."))
-        QTimer.singleShot(2000, lambda: self.test_loading_screen_instance.update_progress("Connecting to services..."))
-        QTimer.singleShot(3000, lambda: self.test_loading_screen_instance.update_status("Almost ready..."))
-        
-        # Auto close after 5 seconds
-        QTimer.singleShot(5000, lambda: self.test_loading_screen_instance.destroy())
-        
-        # Allow click to close
-        original_mouse_press = self.test_loading_screen_instance.mousePressEvent
-        
-        def close_on_click(event):
-            self.test_loading_screen_instance.destroy()
-            self.test_loading_screen_instance = None
-            
-        self.test_loading_screen_instance.mousePressEvent = close_on_click
+        loading_screen = self._get_loading_screen()
+        loading_screen.reset()
+        loading_screen.show()
+
+        # Simulate some activity, then auto close
+        self._loading_test_step = 0
+        self._loading_test_timer.start(self._LOADING_TEST_STEPS[0][0])
+
+    @pyqtSlot()
+    def _advance_loading_test(self):
+        """Apply the next simulated loading step and schedule the one after it."""
+        at_ms, method, text = self._LOADING_TEST_STEPS[self._loading_test_step]
+        if method is None:
+            self._hide_loading_screen()
+            return
+
+        getattr(self._loading_screen, method)(text)
+        self._loading_test_step += 1
+        self._loading_test_timer.start(self._LOADING_TEST_STEPS[self._loading_test_step][0] - at_ms)
 
+    @pyqtSlot()
+    def _hide_loading_screen(self):
+        """Hide the test loading screen and stop its simulated activity."""
+        self._loading_test_timer.stop()
+        self._loading_screen.hide()
+
+    @pyqtSlot()
     def show_about(self):
         """Show about dialog."""
         self.logger.info("Showing about dialog")
         self.about_requested.emit()
 
+    @pyqtSlot()
     def minimize_to_tray(self):
         """Minimize the window to the system tray."""
         self.logger.info("Minimizing to tray")
         self.hide()
 
+    @pyqtSlot()
     def quit_application(self):
         """Quit the application completely (bypasses minimize to tray)."""
         self.logger.info("Quitting application")
         self._force_quit = True
-        from PyQt6.QtWidgets import QApplication
         QApplication.instance().quit()
 
+    @pyqtSlot()
     def toggle_history(self):
         """Toggle the history sidebar visibility."""
         self.logger.info("Toggling history sidebar")
@@ -467,6 +634,12 @@ class ModernMainWindow(QMainWindow):
             # Collapse window back to base size
             new_width = self._base_width + self._edge_tab_width
         
+        # Already there and not mid-animation: nothing to do
+        animation = getattr(self, '_resize_animation', None)
+        animating = animation is not None and animation.state() == animation.State.Running
+        if self.width() == new_width and not animating:
+            return
+
         # Animate the resize for smooth transition
         self._animate_resize(new_width, current_height)
     
@@ -484,32 +657,41 @@ class ModernMainWindow(QMainWindow):
             self._resize_animation = QPropertyAnimation(self, b"geometry")
             self._resize_animation.setDuration(250)
             self._resize_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+            self._target_geo = QRect()  # Reused; the animation copies the value
         
         current_geo = self.geometry()
-        target_geo = QRect(current_geo.x(), current_geo.y(), target_width, target_height)
+        self._target_geo.setRect(current_geo.x(), current_geo.y(), target_width, target_height)
         
         self._resize_animation.stop()
         self._resize_animation.setStartValue(current_geo)
-        self._resize_animation.setEndValue(target_geo)
+        self._resize_animation.setEndValue(self._target_geo)
         self._resize_animation.start()
 
     def refresh_history(self):
         """Refresh the history sidebar content."""
         self.history_sidebar.refresh()
 
+    def add_history_entry(self, entry):
+        """Show a new history entry in the sidebar without reloading it.
+
+        Args:
+            entry: The HistoryEntry that was just added.
+        """
+        self.history_sidebar.add_entry(entry)
+
+    @pyqtSlot(str)
     def _on_history_entry_selected(self, entry_id: str):
         """Handle history entry selection - show full transcription and copy to clipboard."""
+        from history_manager import history_manager
+
         entry = history_manager.get_entry_by_id(entry_id)
         if entry:
-            self.transcription_text.setText(entry.text)
+            self.transcription_text.setPlainText(entry.text)
             
             # Copy to clipboard
             try:
-                from PyQt6.QtWidgets import QApplication
-                clipboard = QApplication.clipboard()
-                clipboard.setText(entry.text)
-                self.set_status("Copied to clipboard")
-                QTimer.singleShot(2000, lambda: self.set_status("Ready to record"))
+                self._clipboard.setText(entry.text)
+                self._flash_status("Copied to clipboard")
                 
                 # Show the copied animation
                 if self.on_show_copied_animation:
@@ -520,18 +702,17 @@ class ModernMainWindow(QMainWindow):
                 self.logger.error(f"Failed to copy to clipboard: {e}")
                 self.logger.info(f"Loaded history entry: {entry_id[:8]}...")
 
+    @pyqtSlot(str)
     def _on_history_entry_copied(self, entry_id: str):
         """Handle history entry copied notification."""
-        self.set_status("Copied to clipboard")
-        # Auto-clear status after delay
-        QTimer.singleShot(2000, lambda: self.set_status("Ready to record"))
+        self._flash_status("Copied to clipboard")
 
+    @pyqtSlot(str)
     def _on_history_entry_deleted(self, entry_id: str):
         """Handle history entry deleted notification."""
-        self.set_status("Entry deleted")
-        # Auto-clear status after delay
-        QTimer.singleShot(2000, lambda: self.set_status("Ready to record"))
+        self._flash_status("Entry deleted")
 
+    @pyqtSlot(str)
     def _on_retranscribe_requested(self, audio_file_path: str):
         """Handle re-transcription request."""
         self.logger.info(f"Re-transcribe requested: {audio_file_path}")
@@ -543,10 +724,10 @@ class ModernMainWindow(QMainWindow):
         """Handle window close event."""
         self.logger.info("Main window closing")
         try:
-            if self.test_loading_screen_instance:
-                self.test_loading_screen_instance.destroy()
+            if self._loading_screen:
+                self._hide_loading_screen()
         except Exception as e:
-            self.logger.debug(f"Error destroying loading screen: {e}")
+            self.logger.debug(f"Error hiding loading screen: {e}")
         
         # If force quit is set, close immediately
         if self._force_quit:
@@ -554,15 +735,7 @@ class ModernMainWindow(QMainWindow):
             event.accept()
             return
         
-        # Check if minimize to tray is enabled (default: True)
-        try:
-            settings = settings_manager.load_all_settings()
-            minimize_tray = settings.get('minimize_tray', True)  # Default to True
-        except Exception as e:
-            self.logger.error(f"Failed to load settings: {e}")
-            minimize_tray = True  # Default to True on error
-        
-        if minimize_tray:
+        if self._minimize_tray:
             # Hide window instead of closing (X button behavior)
             event.ignore()
             try:
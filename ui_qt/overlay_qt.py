@@ -6,17 +6,19 @@ import logging
 import math
 import random
 import time
-from typing import Optional, List
+from typing import Optional, List, Sequence
+import numpy as np
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, QTimer, QRect, QRectF, pyqtSignal, QPoint
-from PyQt6.QtGui import (
-    QPainter, QPainterPath, QColor, QBrush, QPen,
-    QLinearGradient, QFont, QCursor
-)
+from PyQt6.QtCore import Qt, QTimer, QRect, QRectF, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QPainter, QColor, QBrush, QPen, QFont, QCursor
 from config import config
 from settings import settings_manager
 from ui_qt.waveform_styles import style_factory
 from ui_qt.waveform_styles.base_style import BaseWaveformStyle
+from ui_qt.utils.fonts import get_font
+
+# Resolved once; the status text is drawn with it on every frame
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
 
 
 class STTParticle:
@@ -50,6 +52,8 @@ class ModernWaveformOverlay(QWidget):
     """Modern waveform overlay with smooth animations."""
 
     state_changed = pyqtSignal(str)
+    # Emitted with the state whose one-shot animation just ended
+    animation_finished = pyqtSignal(str)
 
     # States
     STATE_IDLE = "idle"
@@ -63,6 +67,18 @@ class ModernWaveformOverlay(QWidget):
     STATE_LARGE_FILE_SPLITTING = "large_file_splitting"
     STATE_LARGE_FILE_PROCESSING = "large_file_processing"
 
+    # Animation timer interval (ms) for states that differ from frame_rate:
+    # the short cancel animation runs smoother, the slow large-file clock
+    # hand needs fewer frames
+    STATE_FRAME_INTERVALS = {
+        STATE_CANCELING: 16,
+        STATE_LARGE_FILE_PROCESSING: 66,
+    }
+
+    # States where only the centered icon animates; their frames repaint
+    # just the icon's rect instead of the whole overlay
+    ICON_ANIMATION_STATES = (STATE_LARGE_FILE_SPLITTING, STATE_LARGE_FILE_PROCESSING)
+
     def __init__(self):
         """Initialize the overlay."""
         super().__init__()
@@ -80,14 +96,40 @@ class ModernWaveformOverlay(QWidget):
         self.overlay_width = config.WAVEFORM_OVERLAY_WIDTH
         self.overlay_height = config.WAVEFORM_OVERLAY_HEIGHT
         self.setFixedSize(self.overlay_width, self.overlay_height)
+        self._update_geometry_cache(self.overlay_width, self.overlay_height)
 
         # State
         self.current_state = self.STATE_IDLE
-        self.audio_levels: List[float] = [0.0] * 20
+        # Fixed buffer for the 20 bar levels, overwritten in place on each update
+        self.audio_levels: np.ndarray = np.zeros(20, dtype=np.float32)
+        self._level_ema = 0.0
         self.animation_time = 0.0
         self.cancel_progress = 0.0
         self.stt_particles: List[STTParticle] = []
 
+        # Pens with fixed colors, shared by every frame
+        amber = QColor(251, 191, 36)
+        cyan = QColor(0, 212, 255)
+        self._pens = {
+            'text': QPen(QColor(224, 224, 255)),
+            'border': QPen(QColor(64, 64, 96, 150), 1),
+            'spinner': QPen(QColor(99, 102, 241), 3),
+            'cancel': QPen(QColor(239, 68, 68), 4),
+            'amber_3': QPen(amber, 3),
+            'amber_text': QPen(amber),
+            'cyan_2': QPen(cyan, 2),
+            'cyan_3': QPen(cyan, 3),
+            'cyan_text': QPen(cyan),
+        }
+        self._cyan_brush = QBrush(cyan)
+        self._background_color = QColor(45, 45, 68, 200)
+        self._bar_colors = {
+            'high': QColor(239, 68, 68),    # Red
+            'mid': QColor(99, 102, 241),    # Indigo
+            'low': QColor(139, 92, 246),    # Purple
+        }
+        self._status_font = get_font(10, QFont.Weight.Bold)
+
         # Large file information for warning states
         self.large_file_info = {
             'file_size_mb': 0.0,
@@ -131,7 +173,7 @@ class ModernWaveformOverlay(QWidget):
             self._draw_background(painter)
 
             # Get drawing rect
-            rect = self.rect()
+            rect = self._rect
 
             # Draw state-specific content using style
             if self.current_state == self.STATE_RECORDING:
@@ -162,28 +204,47 @@ class ModernWaveformOverlay(QWidget):
             # Draw a simple fallback
             try:
                 painter = QPainter(self)
-                painter.fillRect(self.rect(), QColor(45, 45, 68, 200))
-                painter.setPen(QPen(QColor(224, 224, 255)))
-                painter.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+                painter.fillRect(self.rect(), self._background_color)
+                painter.setPen(self._pens['text'])
+                painter.setFont(self._status_font)
                 painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "Error")
             except Exception:
                 pass  # If even fallback fails, just skip
 
+    def resizeEvent(self, event):
+        """Refresh the cached drawing geometry."""
+        super().resizeEvent(event)
+        size = event.size()
+        self._update_geometry_cache(size.width(), size.height())
+
+    def _update_geometry_cache(self, w: int, h: int):
+        """Cache the widget size and the rects every frame draws into.
+
+        Args:
+            w: Widget width in pixels.
+            h: Widget height in pixels.
+        """
+        self._w = w
+        self._h = h
+        self._rect = QRect(0, 0, w, h)
+        self._status_text_rect = QRect(0, h - 25, w, 25)
+        # Covers the large-file icons (centered 10px above the middle) with pen width to spare
+        self._icon_rect = QRect(w // 2 - 32, h // 2 - 42, 64, 64)
+
     def _draw_background(self, painter: QPainter):
         """Draw the background with frosted glass effect."""
-        rect = self.rect()
+        rect = self._rect
 
         # Draw semi-transparent background
-        painter.fillRect(rect, QColor(45, 45, 68, 200))
+        painter.fillRect(rect, self._background_color)
 
         # Draw border
-        painter.setPen(QPen(QColor(64, 64, 96, 150), 1))
+        painter.setPen(self._pens['border'])
         painter.drawRoundedRect(rect, 12, 12)
 
     def _draw_recording_state(self, painter: QPainter):
         """Draw recording state visualization."""
-        rect = self.rect()
-        w, h = rect.width(), rect.height()
+        w, h = self._w, self._h
 
         # Draw waveform bars
         bar_count = 20
@@ -197,11 +258,11 @@ class ModernWaveformOverlay(QWidget):
 
             # Color gradient based on level
             if level > 0.7:
-                color = QColor(239, 68, 68)  # Red
+                color = self._bar_colors['high']
             elif level > 0.4:
-                color = QColor(99, 102, 241)  # Indigo
+                color = self._bar_colors['mid']
             else:
-                color = QColor(139, 92, 246)  # Purple
+                color = self._bar_colors['low']
 
             painter.fillRect(
                 int(x + bar_width * 0.2),
@@ -212,30 +273,28 @@ class ModernWaveformOverlay(QWidget):
             )
 
         # Draw status text
-        painter.setPen(QPen(QColor(224, 224, 255)))
-        painter.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        painter.drawText(rect.adjusted(0, h - 25, 0, 0), Qt.AlignmentFlag.AlignCenter, "Recording...")
+        painter.setPen(self._pens['text'])
+        painter.setFont(self._status_font)
+        painter.drawText(self._status_text_rect, _ALIGN_CENTER, "Recording...")
 
     def _draw_processing_state(self, painter: QPainter):
         """Draw processing state."""
-        rect = self.rect()
-        w, h = rect.width(), rect.height()
+        w, h = self._w, self._h
 
         # Draw rotating spinner
-        painter.setPen(QPen(QColor(99, 102, 241), 3))
+        painter.setPen(self._pens['spinner'])
         spinner_rect = QRect(w // 2 - 20, h // 2 - 20, 40, 40)
         angle = int((self.animation_time * 360) % 360)
         painter.drawArc(spinner_rect, angle * 16, 200 * 16)
 
         # Status text
-        painter.setPen(QPen(QColor(224, 224, 255)))
-        painter.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        painter.drawText(rect.adjusted(0, h - 25, 0, 0), Qt.AlignmentFlag.AlignCenter, "Processing...")
+        painter.setPen(self._pens['text'])
+        painter.setFont(self._status_font)
+        painter.drawText(self._status_text_rect, _ALIGN_CENTER, "Processing...")
 
     def _draw_transcribing_state(self, painter: QPainter):
         """Draw transcribing state."""
-        rect = self.rect()
-        w, h = rect.width(), rect.height()
+        w, h = self._w, self._h
 
         # Draw pulsing circles
         progress = (self.animation_time * 2) % 1.0
@@ -249,21 +308,20 @@ class ModernWaveformOverlay(QWidget):
             painter.drawEllipse(w // 2 - radius, h // 2 - radius, radius * 2, radius * 2)
 
         # Status text
-        painter.setPen(QPen(QColor(224, 224, 255)))
-        painter.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        painter.drawText(rect.adjusted(0, h - 25, 0, 0), Qt.AlignmentFlag.AlignCenter, "Transcribing...")
+        painter.setPen(self._pens['text'])
+        painter.setFont(self._status_font)
+        painter.drawText(self._status_text_rect, _ALIGN_CENTER, "Transcribing...")
 
     def _draw_canceling_state(self, painter: QPainter):
         """Draw canceling state with shrinking X."""
-        rect = self.rect()
-        w, h = rect.width(), rect.height()
+        w, h = self._w, self._h
 
         # Draw shrinking X
         progress = self.cancel_progress  # 0.0 to 1.0
         size = int(40 * (1 - progress * 0.8))
 
         # X lines
-        painter.setPen(QPen(QColor(239, 68, 68), 4))
+        painter.setPen(self._pens['cancel'])
         painter.drawLine(
             w // 2 - size,
             h // 2 - size,
@@ -278,14 +336,13 @@ class ModernWaveformOverlay(QWidget):
         )
 
         # Status text
-        painter.setPen(QPen(QColor(224, 224, 255)))
-        painter.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        painter.drawText(rect.adjusted(0, h - 25, 0, 0), Qt.AlignmentFlag.AlignCenter, "Canceling...")
+        painter.setPen(self._pens['text'])
+        painter.setFont(self._status_font)
+        painter.drawText(self._status_text_rect, _ALIGN_CENTER, "Canceling...")
 
     def _draw_stt_enable_state(self, painter: QPainter):
         """Draw STT enable state with power up particle effect."""
-        rect = self.rect()
-        w, h = rect.width(), rect.height()
+        w, h = self._w, self._h
 
         # Draw checkmark first (behind particles) - fades in after particles converge
         if self.animation_time > 0.4:
@@ -320,14 +377,13 @@ class ModernWaveformOverlay(QWidget):
                 painter.setPen(Qt.PenStyle.NoPen)
 
         # Status text
-        painter.setPen(QPen(QColor(224, 224, 255)))
-        painter.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        painter.drawText(rect.adjusted(0, h - 25, 0, 0), Qt.AlignmentFlag.AlignCenter, "Enabled")
+        painter.setPen(self._pens['text'])
+        painter.setFont(self._status_font)
+        painter.drawText(self._status_text_rect, _ALIGN_CENTER, "Enabled")
 
     def _draw_stt_disable_state(self, painter: QPainter):
         """Draw STT disable state with power down particle effect."""
-        rect = self.rect()
-        w, h = rect.width(), rect.height()
+        w, h = self._w, self._h
 
         # Draw X first (behind particles) - appears quickly then particles explode from it
         if self.animation_time > 0.1:
@@ -363,14 +419,13 @@ class ModernWaveformOverlay(QWidget):
                 painter.setPen(Qt.PenStyle.NoPen)
 
         # Status text
-        painter.setPen(QPen(QColor(224, 224, 255)))
-        painter.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        painter.drawText(rect.adjusted(0, h - 25, 0, 0), Qt.AlignmentFlag.AlignCenter, "Disabled")
+        painter.setPen(self._pens['text'])
+        painter.setFont(self._status_font)
+        painter.drawText(self._status_text_rect, _ALIGN_CENTER, "Disabled")
 
     def _draw_copied_state(self, painter: QPainter):
         """Draw copied to clipboard state with sparkle particle effect."""
-        rect = self.rect()
-        w, h = rect.width(), rect.height()
+        w, h = self._w, self._h
 
         # Draw clipboard icon first (behind particles) - fades in after particles converge
         if self.animation_time > 0.3:
@@ -418,9 +473,9 @@ class ModernWaveformOverlay(QWidget):
                 painter.setPen(Qt.PenStyle.NoPen)
 
         # Status text
-        painter.setPen(QPen(QColor(224, 224, 255)))
-        painter.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        painter.drawText(rect.adjusted(0, h - 25, 0, 0), Qt.AlignmentFlag.AlignCenter, "Copied!")
+        painter.setPen(self._pens['text'])
+        painter.setFont(self._status_font)
+        painter.drawText(self._status_text_rect, _ALIGN_CENTER, "Copied!")
 
     def set_large_file_info(self, file_size_mb: float, chunk_count: int = 0):
         """Set information about the large file being processed.
@@ -433,11 +488,11 @@ class ModernWaveformOverlay(QWidget):
             'file_size_mb': file_size_mb,
             'chunk_count': chunk_count
         }
+        self.update()
 
     def _draw_large_file_splitting_state(self, painter: QPainter):
         """Draw large file splitting warning (for API backends)."""
-        rect = self.rect()
-        w, h = rect.width(), rect.height()
+        w, h = self._w, self._h
 
         # Animated scissors icon in amber
         progress = (self.animation_time * 2) % 1.0
@@ -446,8 +501,7 @@ class ModernWaveformOverlay(QWidget):
         # Scissors blades animation (opening/closing)
         blade_angle = 12 + 8 * math.sin(progress * math.pi * 2)
 
-        amber = QColor(251, 191, 36)
-        painter.setPen(QPen(amber, 3))
+        painter.setPen(self._pens['amber_3'])
 
         # Draw scissors (two crossing blades)
         # Top blade
@@ -466,23 +520,21 @@ class ModernWaveformOverlay(QWidget):
         painter.drawEllipse(int(center_x - 24), int(center_y + blade_angle - 5), 10, 10)
 
         # Status text with file size
-        painter.setPen(QPen(amber))
-        painter.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+        painter.setPen(self._pens['amber_text'])
+        painter.setFont(self._status_font)
         text = f"Splitting ({self.large_file_info['file_size_mb']:.1f} MB)..."
-        painter.drawText(rect.adjusted(0, h - 25, 0, 0), Qt.AlignmentFlag.AlignCenter, text)
+        painter.drawText(self._status_text_rect, _ALIGN_CENTER, text)
 
     def _draw_large_file_processing_state(self, painter: QPainter):
         """Draw large file processing info (for local backend)."""
-        rect = self.rect()
-        w, h = rect.width(), rect.height()
+        w, h = self._w, self._h
 
         # Animated timer/clock in cyan
         progress = (self.animation_time * 0.5) % 1.0
         center_x, center_y = w // 2, h // 2 - 10
         radius = 18
 
-        cyan = QColor(0, 212, 255)
-        painter.setPen(QPen(cyan, 2))
+        painter.setPen(self._pens['cyan_2'])
         painter.setBrush(Qt.BrushStyle.NoBrush)
 
         # Clock circle
@@ -500,21 +552,27 @@ class ModernWaveformOverlay(QWidget):
         hour_length = radius - 10
         hour_x = center_x + int(hour_length * math.cos(hour_angle))
         hour_y = center_y + int(hour_length * math.sin(hour_angle))
-        painter.setPen(QPen(cyan, 3))
+        painter.setPen(self._pens['cyan_3'])
         painter.drawLine(center_x, center_y, hour_x, hour_y)
 
         # Center dot
-        painter.setBrush(QBrush(cyan))
+        painter.setBrush(self._cyan_brush)
         painter.drawEllipse(center_x - 3, center_y - 3, 6, 6)
 
         # Status text with file size
-        painter.setPen(QPen(cyan))
-        painter.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+        painter.setPen(self._pens['cyan_text'])
+        painter.setFont(self._status_font)
         text = f"Processing ({self.large_file_info['file_size_mb']:.1f} MB)..."
-        painter.drawText(rect.adjusted(0, h - 25, 0, 0), Qt.AlignmentFlag.AlignCenter, text)
+        painter.drawText(self._status_text_rect, _ALIGN_CENTER, text)
 
+    @pyqtSlot()
     def _update_animation(self):
         """Update animation time and redraw."""
+        # Nothing to redraw while hidden; showEvent restarts the timer
+        if not self.isVisible():
+            self.timer.stop()
+            return
+
         # Calculate delta time
         current_time = time.time()
         delta_time = current_time - self.last_frame_time
@@ -531,11 +589,17 @@ class ModernWaveformOverlay(QWidget):
             if self.cancel_progress >= 1.0:
                 self.set_state(self.STATE_IDLE)
                 self.timer.stop()
+                self.animation_finished.emit(self.STATE_CANCELING)
+                return
         elif self.current_state in [self.STATE_STT_ENABLE, self.STATE_STT_DISABLE, self.STATE_COPIED]:
             # Update particles
             self._update_stt_particles(delta_time)
 
-        self.update()
+        if self.current_state in self.ICON_ANIMATION_STATES:
+            # Background and status text are unchanged between frames
+            self.update(self._icon_rect)
+        else:
+            self.update()
 
     def set_state(self, state: str):
         """Set the overlay state."""
@@ -544,6 +608,7 @@ class ModernWaveformOverlay(QWidget):
             self.animation_time = 0.0
             self.cancel_progress = 0.0
             self.last_frame_time = time.time()  # Reset to prevent huge delta on first frame
+            self.update()  # Full repaint; later frames may only touch the animated area
 
             # Set canceling start time for style
             if state == self.STATE_CANCELING and self.style:
@@ -562,15 +627,26 @@ class ModernWaveformOverlay(QWidget):
             if state == self.STATE_IDLE:
                 self.timer.stop()
             else:
-                self.timer.start(1000 // self.frame_rate)
+                self.timer.start(self._frame_interval(state))
 
             self.state_changed.emit(state)
-            self.logger.debug(f"Overlay state changed to: {state}")
+            self.logger.debug("Overlay state changed to: %s", state)
 
             # Auto-hide after delay for certain states
             if state in [self.STATE_STT_ENABLE, self.STATE_STT_DISABLE, self.STATE_COPIED]:
                 self.hidden_timer.start(1500)
 
+    def _frame_interval(self, state: str) -> int:
+        """Get the animation timer interval for a state.
+
+        Args:
+            state: Overlay state.
+
+        Returns:
+            Interval in milliseconds.
+        """
+        return self.STATE_FRAME_INTERVALS.get(state, 1000 // self.frame_rate)
+
     def _init_power_up_particles(self):
         """Initialize particles for power up animation - converging to center."""
         self.stt_particles = []
@@ -684,14 +760,30 @@ class ModernWaveformOverlay(QWidget):
 
         self.stt_particles = alive_particles
 
-    def update_audio_levels(self, levels: List[float]):
+    def update_audio_levels(self, levels: Sequence[float]):
         """Update audio level data."""
-        self.audio_levels = levels[:20]  # Keep only 20 levels
+        # Copy into the fixed buffer; the style holds the same array, so no
+        # per-update allocation. Bars without a level are cleared.
+        count = min(len(levels), self.audio_levels.size)
+
+        # Silence and steady input repeat the same vector; once the running
+        # average has caught up with its mean there is nothing to update
+        if (count == self.audio_levels.size
+                and np.array_equal(self.audio_levels, levels)
+                and abs(self._level_ema - float(self.audio_levels.mean())) < 1e-3):
+            return
+
+        self.audio_levels[:count] = levels[:count]
+        self.audio_levels[count:] = 0.0
+
+        # Overall level as a running average of the mean over all bars
+        if count:
+            level = float(self.audio_levels[:count].mean())
+            self._level_ema = 0.9 * self._level_ema + 0.1 * level
 
         # Update style with audio levels
         if self.style:
-            current_level = sum(levels) / len(levels) if levels else 0.0
-            self.style.update_audio_levels(self.audio_levels, current_level)
+            self.style.update_audio_levels(self.audio_levels, self._level_ema)
 
     def hide(self):
         """Hide the overlay and stop animations."""
@@ -728,6 +820,22 @@ class ModernWaveformOverlay(QWidget):
         elif self.current_state == self.STATE_IDLE:
             self.set_state(self.STATE_RECORDING)
 
+    def showEvent(self, event):
+        """Resume the animation timer for an active state."""
+        super().showEvent(event)
+        if self.current_state != self.STATE_IDLE and not self.timer.isActive():
+            self.last_frame_time = time.time()
+            self.timer.start(self._frame_interval(self.current_state))
+
+    def hideEvent(self, event):
+        """Stop animating however the overlay was hidden.
+
+        hide() is not virtual in Qt, so setVisible(False) and close()
+        bypass the override above.
+        """
+        self.timer.stop()
+        super().hideEvent(event)
+
     def closeEvent(self, event):
         """Handle closing."""
         self.timer.stop()
@@ -69,17 +69,7 @@ class SystemTrayManager(QSystemTrayIcon):
     def _setup_menu(self):
         """Setup the tray context menu."""
         self.menu = QMenu()
-        self.menu.setStyleSheet("""
-            QMenu {
-                background-color: #2d2d44;
-                color: #e0e0ff;
-                border: 1px solid #404060;
-                border-radius: 6px;
-            }
-            QMenu::item:selected {
-                background-color: #6366f1;
-            }
-        """)
+        self.menu.setObjectName("trayMenu")  # Styled in theme.qss
 
         # Show action
         show_action = self.menu.addAction("Show")
@@ -91,8 +81,8 @@ class SystemTrayManager(QSystemTrayIcon):
 
         # Toggle recording action
         self.menu.addSeparator()
-        toggle_action = self.menu.addAction("Start Recording")
-        toggle_action.triggered.connect(self._on_toggle)
+        self._toggle_action = self.menu.addAction("Start Recording")
+        self._toggle_action.triggered.connect(self._on_toggle)
 
         # Settings action
         self.menu.addSeparator()
@@ -156,11 +146,8 @@ class SystemTrayManager(QSystemTrayIcon):
 
     def set_recording(self, is_recording: bool):
         """Update the menu based on recording state."""
-        for action in self.menu.actions():
-            if "Recording" in action.text():
-                if is_recording:
-                    action.setText("Stop Recording")
-                else:
-                    action.setText("Start Recording")
-                break
+        text = "Stop Recording" if is_recording else "Start Recording"
+        # Skip the menu update when the state is reported again
+        if self._toggle_action.text() != text:
+            self._toggle_action.setText(text)
 
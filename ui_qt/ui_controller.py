@@ -4,19 +4,64 @@ Manages the main window, overlay, and dialogs.
 Bridges between UI and application logic.
 """
 import logging
-from typing import Optional, Callable, List
-from PyQt6.QtCore import QTimer, pyqtSignal, QObject
+from functools import lru_cache
+from typing import Optional, Callable, Sequence, Tuple
+import numpy as np
+from PyQt6.QtCore import QSize, QTimer, pyqtSignal, pyqtSlot, QObject
 from PyQt6.QtWidgets import QMessageBox, QFileDialog
 
-from config import config
 from ui_qt.main_window_qt import ModernMainWindow
 from ui_qt.overlay_qt import ModernWaveformOverlay
 from ui_qt.system_tray_qt import SystemTrayManager
-from ui_qt.dialogs.settings_dialog import SettingsDialog
-from ui_qt.dialogs.hotkey_dialog import HotkeyDialog
-from ui_qt.dialogs.upload_preview_dialog import UploadPreviewDialog
 from audio_processor import audio_processor
 
+ABOUT_TEXT = (
+    "OpenWhisper - Speech-to-Text Application\n\n"
+    "Record audio and turn it into text. Works offline with local Whisper or online with OpenAI.\n\n"
+    "Features:\n"
+    "• Local or cloud transcription\n"
+    "• Global hotkeys (press * to record)\n"
+    "• Cool waveform visualizations\n"
+    "• Auto-pastes text for you\n"
+    "• Runs in the background\n\n"
+    "Open source and free to use."
+)
+
+# Status keywords mapped to overlay states (similar to old Tkinter app),
+# checked in order against the lowercased status. Canceling plays the
+# cancel animation and idle hides the overlay.
+_STATUS_OVERLAY_STATES = (
+    ("cancel", ModernWaveformOverlay.STATE_CANCELING),
+    ("recording", ModernWaveformOverlay.STATE_RECORDING),
+    ("processing", ModernWaveformOverlay.STATE_PROCESSING),
+    ("transcribing", ModernWaveformOverlay.STATE_TRANSCRIBING),
+    ("stt enabled", ModernWaveformOverlay.STATE_STT_ENABLE),
+    ("stt disabled", ModernWaveformOverlay.STATE_STT_DISABLE),
+    ("complete", ModernWaveformOverlay.STATE_IDLE),
+    ("ready", ModernWaveformOverlay.STATE_IDLE),
+    ("failed", ModernWaveformOverlay.STATE_IDLE),
+    ("error", ModernWaveformOverlay.STATE_IDLE),
+)
+
+
+@lru_cache(maxsize=64)
+def _overlay_state_for_status(status: str) -> Optional[str]:
+    """Get the overlay state a status message maps to.
+
+    Status messages repeat, so results are cached.
+
+    Args:
+        status: Status message.
+
+    Returns:
+        The overlay state, or None if the status leaves the overlay alone.
+    """
+    lower_status = status.lower()
+    for keyword, state in _STATUS_OVERLAY_STATES:
+        if keyword in lower_status:
+            return state
+    return None
+
 
 class UIController(QObject):
     """Controls the UI components and manages their interactions."""
@@ -28,7 +73,13 @@ class UIController(QObject):
     model_changed = pyqtSignal(str)
     transcription_received = pyqtSignal(str)
     status_changed = pyqtSignal(str)
-    audio_levels_updated = pyqtSignal(list)
+    audio_levels_updated = pyqtSignal(object)
+
+    # Overlay states the cancel animation may end in before hiding
+    CANCEL_FINISH_STATES = frozenset({
+        ModernWaveformOverlay.STATE_CANCELING,
+        ModernWaveformOverlay.STATE_IDLE,
+    })
 
     def __init__(self):
         """Initialize UI controller."""
@@ -40,9 +91,13 @@ class UIController(QObject):
         self.overlay = ModernWaveformOverlay()
         self.tray_manager = SystemTrayManager(self.main_window)
 
+        # Bound once for the per-frame audio levels path
+        self._update_overlay_levels = self.overlay.update_audio_levels
+
         # State
         self.is_recording = False
-        self.audio_levels: List[float] = [0.0] * 20
+        # Reused levels buffer, emitted by reference to the overlay
+        self.audio_levels = np.zeros(20, dtype=np.float32)
 
         # Callbacks for external handlers
         self.on_record_start: Optional[Callable] = None
@@ -54,10 +109,21 @@ class UIController(QObject):
         self.on_upload_audio: Optional[Callable] = None  # Callback for audio file upload
         self.on_whisper_settings_changed: Optional[Callable] = None  # Callback for whisper engine reload
 
-        # Timer to hide overlay after cancel animation completes
-        self.cancel_animation_timer = QTimer()
-        self.cancel_animation_timer.setSingleShot(True)
-        self.cancel_animation_timer.timeout.connect(self._on_cancel_animation_finished)
+        # Dialogs are imported and created on first open, then reused
+        self._settings_dialog = None
+        self._hotkey_dialog = None
+        self._upload_dialog = None
+        self._about_box: Optional[QMessageBox] = None
+
+        # Hotkeys last shown on the main window buttons
+        self._displayed_hotkeys: Optional[Tuple[str, str, str]] = None
+
+        # Audio levels arrive from the recorder thread far faster than the
+        # overlay repaints; keep only the latest and forward it once per frame
+        self._levels_dirty = False
+        self._levels_timer = QTimer(self)
+        self._levels_timer.setInterval(16)
+        self._levels_timer.timeout.connect(self._flush_audio_levels)
 
         self._setup_connections()
 
@@ -88,14 +154,14 @@ class UIController(QObject):
 
         # Overlay signals
         self.overlay.state_changed.connect(self._on_overlay_state_changed)
+        self.overlay.animation_finished.connect(self._on_cancel_animation_finished)
 
-        # Internal signals
-        self.record_started.connect(self._on_internal_record_started)
-        self.record_stopped.connect(self._on_internal_record_stopped)
-        self.transcription_received.connect(self._on_internal_transcription)
-        self.status_changed.connect(self._on_internal_status_changed)
-        self.audio_levels_updated.connect(self._on_internal_audio_levels)
+        # The controller's own signals are not connected here: every producer
+        # runs on the GUI thread (recorder levels are handed over by the
+        # levels timer), so their handlers are called directly
+        # and the signals are only emitted for external listeners
 
+    @pyqtSlot(bool)
     def _on_record_toggled(self, is_recording: bool):
         """Handle record button toggle from main window."""
         if is_recording:
@@ -103,27 +169,35 @@ class UIController(QObject):
         else:
             self.stop_recording()
 
+    @pyqtSlot(str)
     def _on_model_changed(self, model_name: str):
         """Handle model selection change."""
-        self.logger.info(f"Model changed to: {model_name}")
+        self.logger.info("Model changed to: %s", model_name)
         if self.on_model_changed:
             self.on_model_changed(model_name)
-        self.model_changed.emit(model_name)
+        # The app is driven by the callback; the signal is only for external
+        # listeners, so skip the emit when nothing is connected
+        if self.receivers(self.model_changed):
+            self.model_changed.emit(model_name)
 
+    @pyqtSlot()
     def _on_tray_show(self):
         """Handle show from tray."""
         self.main_window.showNormal()
         self.logger.debug("Window shown from tray")
 
+    @pyqtSlot()
     def _on_tray_hide(self):
         """Handle hide from tray."""
         self.main_window.hide()
         self.logger.debug("Window hidden to tray")
 
+    @pyqtSlot()
     def _on_tray_exit(self):
         """Handle exit from tray."""
         self.logger.info("Exit requested from tray")
 
+    @pyqtSlot()
     def _on_tray_toggle_recording(self):
         """Handle toggle recording from tray."""
         if self.is_recording:
@@ -131,27 +205,28 @@ class UIController(QObject):
         else:
             self.start_recording()
 
+    @pyqtSlot(str)
     def _on_overlay_state_changed(self, state: str):
         """Handle overlay state change."""
-        self.logger.debug(f"Overlay state changed to: {state}")
+        self.logger.debug("Overlay state changed to: %s", state)
+        # Hotkey recordings reach the overlay through set_status rather than
+        # record_started, so the overlay state drives the levels timer
+        if state == self.overlay.STATE_RECORDING:
+            self._levels_timer.start()
+        else:
+            self._levels_timer.stop()
 
     def _on_internal_record_started(self):
         """Handle internal record started signal."""
         self.tray_manager.set_recording(True)
         # Show overlay with recording state if not already visible
-        if not self.overlay.isVisible():
-            self.overlay.show_at_cursor(self.overlay.STATE_RECORDING)
-        else:
-            self.overlay.set_state(self.overlay.STATE_RECORDING)
+        self._show_overlay_state(self.overlay.STATE_RECORDING)
 
     def _on_internal_record_stopped(self):
         """Handle internal record stopped signal."""
         self.tray_manager.set_recording(False)
         # Show overlay with processing state if not already visible
-        if not self.overlay.isVisible():
-            self.overlay.show_at_cursor(self.overlay.STATE_PROCESSING)
-        else:
-            self.overlay.set_state(self.overlay.STATE_PROCESSING)
+        self._show_overlay_state(self.overlay.STATE_PROCESSING)
 
     def _on_internal_transcription(self, text: str):
         """Handle transcription received."""
@@ -163,10 +238,6 @@ class UIController(QObject):
         """Handle status change."""
         self.main_window.set_status(status)
 
-    def _on_internal_audio_levels(self, levels: List[float]):
-        """Handle audio levels update."""
-        self.overlay.update_audio_levels(levels)
-
     def start_recording(self):
         """Start recording."""
         self.is_recording = True
@@ -180,7 +251,9 @@ class UIController(QObject):
         if self.on_record_start:
             self.on_record_start()
 
-        self.record_started.emit()
+        self._on_internal_record_started()
+        if self.receivers(self.record_started):
+            self.record_started.emit()
 
     def stop_recording(self):
         """Stop recording."""
@@ -195,7 +268,9 @@ class UIController(QObject):
         if self.on_record_stop:
             self.on_record_stop()
 
-        self.record_stopped.emit()
+        self._on_internal_record_stopped()
+        if self.receivers(self.record_stopped):
+            self.record_stopped.emit()
 
     def cancel_recording(self):
         """Cancel recording."""
@@ -210,13 +285,16 @@ class UIController(QObject):
         if self.on_record_cancel:
             self.on_record_cancel()
 
-        self.record_canceled.emit()
+        if self.receivers(self.record_canceled):
+            self.record_canceled.emit()
         self.main_window.clear_transcription()
         self._start_cancel_animation()
 
     def set_transcription(self, text: str):
         """Set transcription text."""
-        self.transcription_received.emit(text)
+        self._on_internal_transcription(text)
+        if self.receivers(self.transcription_received):
+            self.transcription_received.emit(text)
 
     def set_device_info(self, device_info: str):
         """Set the persistent device info display (e.g., 'cuda (float16)').
@@ -226,50 +304,77 @@ class UIController(QObject):
         """
         self.main_window.set_device_info(device_info)
 
+    @pyqtSlot(str)
     def set_status(self, status: str):
         """Set status message and update overlay state based on status."""
-        self.status_changed.emit(status)
-        lower_status = status.lower()
+        self._on_internal_status_changed(status)
+        if self.receivers(self.status_changed):
+            self.status_changed.emit(status)
 
-        if "cancel" in lower_status:
-            self._start_cancel_animation()
+        # Keep overlay visibility in step with the status
+        state = _overlay_state_for_status(status)
+        if state is None:
             return
-
-        # Map status messages to overlay states (similar to old Tkinter app)
-        # This ensures overlay visibility is automatically managed
-        if "recording" in lower_status:
-            if not self.overlay.isVisible():
-                self.overlay.show_at_cursor(self.overlay.STATE_RECORDING)
-            else:
-                self.overlay.set_state(self.overlay.STATE_RECORDING)
-        elif "processing" in lower_status:
-            if not self.overlay.isVisible():
-                self.overlay.show_at_cursor(self.overlay.STATE_PROCESSING)
-            else:
-                self.overlay.set_state(self.overlay.STATE_PROCESSING)
-        elif "transcribing" in lower_status:
-            if not self.overlay.isVisible():
-                self.overlay.show_at_cursor(self.overlay.STATE_TRANSCRIBING)
-            else:
-                self.overlay.set_state(self.overlay.STATE_TRANSCRIBING)
-        elif "STT Enabled" in status:
-            if not self.overlay.isVisible():
-                self.overlay.show_at_cursor(self.overlay.STATE_STT_ENABLE)
-            else:
-                self.overlay.set_state(self.overlay.STATE_STT_ENABLE)
-        elif "STT Disabled" in status:
-            if not self.overlay.isVisible():
-                self.overlay.show_at_cursor(self.overlay.STATE_STT_DISABLE)
-            else:
-                self.overlay.set_state(self.overlay.STATE_STT_DISABLE)
-        elif any(keyword in lower_status for keyword in ["complete", "ready", "failed", "error"]):
-            # Hide overlay
+        if state == self.overlay.STATE_IDLE:
             self.hide_overlay()
+        else:
+            # Canceling included: the overlay reports when its animation ends
+            self._show_overlay_state(state)
+
+    def update_audio_levels(self, levels: Sequence[float]):
+        """Store the latest audio levels for the next display frame.
+
+        Called from the recorder thread; the levels are copied into the
+        reused buffer and forwarded to the overlay by the levels timer on
+        the GUI thread.
+
+        Args:
+            levels: Per-bar audio levels.
+        """
+        count = min(len(levels), self.audio_levels.size)
+        self.audio_levels[:count] = levels[:count]
+        self.audio_levels[count:] = 0.0
+        self._levels_dirty = True
 
-    def update_audio_levels(self, levels: List[float]):
-        """Update audio level display."""
-        self.audio_levels = levels
-        self.audio_levels_updated.emit(levels)
+    def update_audio_level(self, level: float):
+        """Store a single overall audio level for every bar.
+
+        Same as update_audio_levels with a uniform vector, without building
+        one per recorder callback.
+
+        Args:
+            level: Audio level from 0.0 to 1.0.
+        """
+        self.audio_levels.fill(level)
+        self._levels_dirty = True
+
+    @pyqtSlot()
+    def _flush_audio_levels(self):
+        """Emit the latest audio levels if they changed since the last frame."""
+        if not self.overlay.isVisible():
+            # Hiding resets the overlay to idle without a state change, so
+            # stop here; showing the recording state restarts the timer
+            self._levels_timer.stop()
+            return
+        if not self._levels_dirty:
+            return
+        self._levels_dirty = False
+        levels = self.audio_levels
+        self._update_overlay_levels(levels)
+        if self.receivers(self.audio_levels_updated):
+            self.audio_levels_updated.emit(levels)
+
+    def _show_overlay_state(self, state: str):
+        """Switch the overlay to a state, showing it at the cursor if hidden.
+
+        Args:
+            state: Overlay state to display.
+        """
+        overlay = self.overlay
+        if overlay.isVisible():
+            overlay.set_state(state)
+        else:
+            overlay.show_at_cursor(state)
 
     def show_overlay(self):
         """Show the overlay."""
@@ -283,6 +388,7 @@ class UIController(QObject):
         """Show the copied to clipboard animation overlay."""
         self.overlay.show_at_cursor(self.overlay.STATE_COPIED)
 
+    @pyqtSlot()
     def toggle_overlay(self):
         """Toggle the overlay visibility."""
         if self.overlay.isVisible():
@@ -290,6 +396,7 @@ class UIController(QObject):
         else:
             self.show_overlay()
 
+    @pyqtSlot(str)
     def _on_test_overlay_requested(self, state: str):
         """Handle test overlay state request from menu."""
         self.logger.info(f"Testing overlay state: {state}")
@@ -318,22 +425,19 @@ class UIController(QObject):
             self.logger.warning(f"Unknown overlay state: {state}")
 
     def _start_cancel_animation(self):
-        """Show the cancel animation and schedule hide."""
-        self.cancel_animation_timer.stop()
+        """Show the cancel animation; the overlay reports when it ends."""
+        self._show_overlay_state(self.overlay.STATE_CANCELING)
 
-        if not self.overlay.isVisible():
-            self.overlay.show_at_cursor(self.overlay.STATE_CANCELING)
-        else:
-            self.overlay.set_state(self.overlay.STATE_CANCELING)
+    @pyqtSlot(str)
+    def _on_cancel_animation_finished(self, state: str):
+        """Hide the overlay once its cancel animation completes.
 
-        self.cancel_animation_timer.start(config.CANCELLATION_ANIMATION_DURATION_MS + 200)
-
-    def _on_cancel_animation_finished(self):
-        """Cleanup after cancel animation completes."""
-        if self.overlay.current_state not in {
-            self.overlay.STATE_CANCELING,
-            self.overlay.STATE_IDLE
-        }:
+        Args:
+            state: Overlay state whose animation finished.
+        """
+        if state != self.overlay.STATE_CANCELING:
+            return
+        if self.overlay.current_state not in self.CANCEL_FINISH_STATES:
             return
         self.hide_overlay()
 
@@ -347,34 +451,49 @@ class UIController(QObject):
         """Hide the main window."""
         self.main_window.hide()
 
+    @pyqtSlot()
     def open_settings_dialog(self):
         """Open the settings dialog."""
-        dialog = SettingsDialog(self.main_window)
-        # Connect hotkey button in settings to hotkey dialog
-        dialog.tabs.setCurrentIndex(0)  # Default to general
-
-        # Connect settings changed signal
-        def on_settings_changed(settings: dict):
-            if settings.get('_whisper_settings_changed', False):
-                if self.on_whisper_settings_changed:
-                    self.on_whisper_settings_changed()
-
-        dialog.settings_changed.connect(on_settings_changed)
-        dialog.exec()
-
+        if self._settings_dialog is None:
+            from ui_qt.dialogs.settings_dialog import SettingsDialog
+            self._settings_dialog = SettingsDialog(self.main_window)
+            self._settings_dialog.settings_changed.connect(self._on_settings_changed)
+        elif self._settings_dialog.isVisible():
+            # Already open (e.g. reopened from the tray); don't reload over edits
+            self._settings_dialog.raise_()
+            self._settings_dialog.activateWindow()
+            return
+        else:
+            self._settings_dialog.reload_settings()
+        self._settings_dialog.exec()
+
+    @pyqtSlot(dict)
+    def _on_settings_changed(self, settings: dict):
+        """Apply settings saved from the settings dialog."""
+        self.main_window.set_minimize_to_tray(settings.get('minimize_tray', True))
+        if settings.get('_whisper_settings_changed', False):
+            if self.on_whisper_settings_changed:
+                self.on_whisper_settings_changed()
+
+    @pyqtSlot()
     def open_hotkey_dialog(self):
         """Open the hotkey configuration dialog."""
-        dialog = HotkeyDialog(self.main_window)
-        
-        def on_hotkeys_save(hotkeys):
-            if self.on_hotkeys_changed:
-                self.on_hotkeys_changed(hotkeys)
-            # Update the hotkey display in the main window
-            self.update_hotkey_display(hotkeys)
-                
-        dialog.on_hotkeys_save = on_hotkeys_save
-        dialog.exec()
+        if self._hotkey_dialog is None:
+            from ui_qt.dialogs.hotkey_dialog import HotkeyDialog
+            self._hotkey_dialog = HotkeyDialog(self.main_window)
+            self._hotkey_dialog.on_hotkeys_save = self._on_hotkeys_save
+        else:
+            self._hotkey_dialog.reload_hotkeys()
+        self._hotkey_dialog.exec()
 
+    def _on_hotkeys_save(self, hotkeys: dict):
+        """Apply hotkeys saved from the hotkey dialog."""
+        if self.on_hotkeys_changed:
+            self.on_hotkeys_changed(hotkeys)
+        # Update the hotkey display in the main window
+        self.update_hotkey_display(hotkeys)
+
+    @pyqtSlot()
     def open_upload_audio_dialog(self):
         """Open file dialog to select an audio file for transcription."""
         self.logger.info("Opening upload audio dialog")
@@ -399,10 +518,14 @@ class UIController(QObject):
         try:
             preview = audio_processor.preview_file(file_path)
             
-            # Show preview dialog
-            dialog = UploadPreviewDialog(preview, self.main_window)
-            dialog.on_proceed = self._handle_upload_audio
-            dialog.exec()
+            # Show preview dialog; only needed on the upload path
+            if self._upload_dialog is None:
+                from ui_qt.dialogs.upload_preview_dialog import UploadPreviewDialog
+                self._upload_dialog = UploadPreviewDialog(preview, self.main_window)
+                self._upload_dialog.on_proceed = self._handle_upload_audio
+            else:
+                self._upload_dialog.reset(preview)
+            self._upload_dialog.exec()
             
         except FileNotFoundError as e:
             self.logger.error(f"File not found: {e}")
@@ -443,26 +566,29 @@ class UIController(QObject):
         Args:
             hotkeys: Dictionary with hotkey mappings
         """
-        record_key = hotkeys.get('record_toggle', '*')
-        cancel_key = hotkeys.get('cancel', '-')
-        enable_disable_key = hotkeys.get('enable_disable', 'Ctrl+Alt+*')
-        self.main_window.update_hotkeys(record_key, cancel_key, enable_disable_key)
+        keys = (
+            hotkeys.get('record_toggle', '*'),
+            hotkeys.get('cancel', '-'),
+            hotkeys.get('enable_disable', 'Ctrl+Alt+*'),
+        )
+        # Saving the dialog without edits leaves the buttons as they are
+        if keys == self._displayed_hotkeys:
+            return
+        self._displayed_hotkeys = keys
+        self.main_window.update_hotkeys(*keys)
 
+    @pyqtSlot()
     def show_about_dialog(self):
         """Show the about dialog."""
-        QMessageBox.about(
-            self.main_window,
-            "About OpenWhisper",
-            "OpenWhisper - Speech-to-Text Application\n\n"
-            "Record audio and turn it into text. Works offline with local Whisper or online with OpenAI.\n\n"
-            "Features:\n"
-            "• Local or cloud transcription\n"
-            "• Global hotkeys (press * to record)\n"
-            "• Cool waveform visualizations\n"
-            "• Auto-pastes text for you\n"
-            "• Runs in the background\n\n"
-            "Open source and free to use."
-        )
+        if self._about_box is None:
+            box = QMessageBox(self.main_window)
+            box.setWindowTitle("About OpenWhisper")
+            box.setText(ABOUT_TEXT)
+            # Use the window icon like QMessageBox.about does
+            icon = box.windowIcon()
+            box.setIconPixmap(icon.pixmap(icon.actualSize(QSize(64, 64))))
+            self._about_box = box
+        self._about_box.exec()
 
     def get_model_value(self) -> str:
         """Get the selected model value."""
@@ -472,6 +598,15 @@ class UIController(QObject):
         """Refresh the history sidebar."""
         self.main_window.refresh_history()
 
+    def add_history_entry(self, entry):
+        """Show a new history entry in the sidebar.
+
+        Args:
+            entry: The HistoryEntry that was just added.
+        """
+        self.main_window.add_history_entry(entry)
+
+    @pyqtSlot(str)
     def _on_retranscribe_requested(self, audio_file_path: str):
         """Handle re-transcription request from main window signal."""
         self._handle_retranscribe(audio_file_path)
@@ -486,12 +621,11 @@ class UIController(QObject):
         """Cleanup resources."""
         self.logger.info("Starting UI Controller cleanup...")
         
-        # Stop the cancel animation timer
+        # Stop forwarding audio levels
         try:
-            if self.cancel_animation_timer.isActive():
-                self.cancel_animation_timer.stop()
+            self._levels_timer.stop()
         except Exception as e:
-            self.logger.debug(f"Error stopping cancel animation timer: {e}")
+            self.logger.debug(f"Error stopping audio levels timer: {e}")
         
         # Stop overlay timer and close
         try:
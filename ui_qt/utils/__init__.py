@@ -2,5 +2,6 @@
 Utility modules for PyQt6 UI.
 """
 from ui_qt.utils.theme_manager import ThemeManager
+from ui_qt.utils.fonts import get_font
 
-__all__ = ["ThemeManager"]
+__all__ = ["ThemeManager", "get_font"]
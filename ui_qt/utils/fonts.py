@@ -0,0 +1,28 @@
+"""
+Shared font cache for PyQt6 UI.
+"""
+from typing import Dict, Tuple
+from PyQt6.QtGui import QFont
+
+# QFont needs a QApplication, so fonts are built on first use rather than at
+# import time and then shared by every widget that asks for the same one.
+_FONTS: Dict[Tuple[str, int, QFont.Weight], QFont] = {}
+
+
+def get_font(size: int, weight: QFont.Weight = QFont.Weight.Normal,
+             family: str = "Segoe UI") -> QFont:
+    """Get a shared font, creating it on first call.
+
+    Args:
+        size: Point size.
+        weight: Font weight.
+        family: Font family.
+
+    Returns:
+        The cached QFont. Callers must not modify it; copy it first if needed.
+    """
+    key = (family, size, weight)
+    font = _FONTS.get(key)
+    if font is None:
+        font = _FONTS[key] = QFont(family, size, weight)
+    return font
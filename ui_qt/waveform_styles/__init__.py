@@ -2,6 +2,13 @@
 PyQt6 Waveform visualization styles.
 """
 from .base_style import BaseWaveformStyle
-from .particle_style import ParticleStyle
 
-__all__ = ['BaseWaveformStyle', 'ModernStyle', 'ParticleStyle']
+__all__ = ['BaseWaveformStyle', 'ParticleStyle']
+
+
+def __getattr__(name):
+    # Concrete styles are imported on first access (see style_factory)
+    if name == 'ParticleStyle':
+        from .particle_style import ParticleStyle
+        return ParticleStyle
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,9 +3,11 @@ Base class for all PyQt6 waveform overlay styles.
 Defines the interface that all styles must implement.
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
-from PyQt6.QtGui import QPainter, QColor, QPen, QFont
+from typing import Dict, Any, Sequence
+import numpy as np
+from PyQt6.QtGui import QPainter, QColor, QPen
 from PyQt6.QtCore import QRect
+from ui_qt.utils.fonts import get_font
 import time
 import math
 
@@ -28,9 +30,15 @@ class BaseWaveformStyle(ABC):
         # Animation state
         self.animation_time = 0.0
         self.last_frame_time = time.time()
+        self._last_draw_time = -1.0
+        self._min_frame_dt = 1.0 / 60.0
+        self._levels_pending = False
+
+        # Status text font, shared by every frame
+        self._text_font = get_font(10)
 
         # Audio data
-        self.audio_levels: List[float] = []
+        self.audio_levels: np.ndarray = np.zeros(0, dtype=np.float32)
         self.current_level = 0.0
         self.max_level = 0.0
 
@@ -54,16 +62,19 @@ class BaseWaveformStyle(ABC):
         """Get the description of this style."""
         return self._description
 
-    def update_audio_levels(self, levels: List[float], current_level: float = 0.0):
+    def update_audio_levels(self, levels: Sequence[float], current_level: float = 0.0):
         """Update audio levels for visualization.
 
         Args:
-            levels: List of audio levels for each frequency band/bar
+            levels: Audio levels for each frequency band/bar. A float32 array
+                is stored as-is (styles never mutate it), anything else is
+                converted once.
             current_level: Current overall audio level (0.0 to 1.0)
         """
-        self.audio_levels = levels.copy() if levels else []
+        self.audio_levels = np.asarray(levels, dtype=np.float32)
         self.current_level = max(0.0, min(1.0, current_level))
         self.max_level = max(self.max_level * 0.99, self.current_level)
+        self._levels_pending = True
 
     def update_animation_time(self, delta_time: float):
         """Update the animation time.
@@ -73,6 +84,23 @@ class BaseWaveformStyle(ABC):
         """
         self.animation_time += delta_time
 
+    def _frame_due(self, force: bool = False) -> bool:
+        """Check whether enough animation time has passed to step the simulation.
+
+        Repaints requested faster than the display refresh (expose events,
+        resizes, etc.) redraw the previous state instead of advancing it.
+
+        Args:
+            force: Step regardless of elapsed time (e.g. new audio levels arrived)
+
+        Returns:
+            True if the caller should advance its animation state
+        """
+        if not force and self.animation_time - self._last_draw_time < self._min_frame_dt:
+            return False
+        self._last_draw_time = self.animation_time
+        return True
+
     def get_cancellation_progress(self) -> float:
         """Get cancellation animation progress (0.0 to 1.0).
 
@@ -167,8 +195,7 @@ class BaseWaveformStyle(ABC):
         # Draw text with fade
         text_color = QColor(255, 255, 255, opacity)
         painter.setPen(text_color)
-        font = QFont("Segoe UI", 10)
-        painter.setFont(font)
+        painter.setFont(self._text_font)
 
         text_rect = QRect(0, rect.height() - 25, rect.width(), 20)
         painter.drawText(text_rect, 0x0004 | 0x0080, message)  # AlignCenter | AlignBottom
@@ -196,8 +223,7 @@ class BaseWaveformStyle(ABC):
 
         # Draw text
         painter.setPen(QColor(255, 255, 255))
-        font = QFont("Segoe UI", 10)
-        painter.setFont(font)
+        painter.setFont(self._text_font)
 
         text_rect = QRect(0, rect.height() - 25, rect.width(), 20)
         painter.drawText(text_rect, 0x0004 | 0x0080, message)
@@ -230,8 +256,7 @@ class BaseWaveformStyle(ABC):
 
         # Draw text
         painter.setPen(QColor(255, 255, 255))
-        font = QFont("Segoe UI", 10)
-        painter.setFont(font)
+        painter.setFont(self._text_font)
 
         text_rect = QRect(0, rect.height() - 25, rect.width(), 20)
         painter.drawText(text_rect, 0x0004 | 0x0080, message)
@@ -8,8 +8,18 @@ import time
 from typing import Dict, Any, List, Optional, Tuple
 from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QBrush
 from PyQt6.QtCore import QRect, QRectF, Qt
+from ui_qt.utils.fonts import get_font
 from .base_style import BaseWaveformStyle
 
+# Particle brushes and glow pens are cached per quantized hue/life bucket;
+# 5 degree hue and ~7/255 brightness steps, too fine to show as banding on
+# particles this small
+HUE_BUCKETS = 72
+LIFE_BUCKETS = 32
+
+# Resolved once; the status text is drawn with it on every frame
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+
 
 class Particle:
     """Individual particle with physics properties."""
@@ -85,6 +95,8 @@ class ParticleStyle(BaseWaveformStyle):
         self._cancel_initialized = False
         self._last_cancel_progress = 1.0
         self._last_cancel_update: Optional[float] = None
+        self._bucket_paint: Dict[Tuple[int, int], Tuple[QBrush, QPen]] = {}
+        self._bold_text_font = get_font(10, QFont.Weight.Bold)
 
     def _hex_to_qcolor(self, hex_color: str) -> QColor:
         """Convert hex color string to QColor."""
@@ -102,17 +114,20 @@ class ParticleStyle(BaseWaveformStyle):
         # Actually base_style has update_animation_time which updates self.animation_time
         # We can use a fixed dt for physics stability or calculate it if we tracked last time
         
-        # Calculate audio energy
-        audio_energy = sum(self.audio_levels) / len(self.audio_levels) if self.audio_levels else 0.0
+        # New audio levels always advance the simulation
+        if self._frame_due(force=self._levels_pending):
+            self._levels_pending = False
 
-        # Emit new particles based on audio
-        emission_multiplier = 1.0 + audio_energy * self.audio_response
-        particles_to_emit = int(self.emission_rate * emission_multiplier * dt)
+            # Calculate audio energy
+            audio_energy = float(self.audio_levels.mean()) if self.audio_levels.size else 0.0
 
-        self._emit_audio_particles(particles_to_emit, audio_energy)
+            # Emit new particles based on audio
+            emission_multiplier = 1.0 + audio_energy * self.audio_response
+            particles_to_emit = int(self.emission_rate * emission_multiplier * dt)
+
+            self._emit_audio_particles(particles_to_emit, audio_energy)
+            self._update_particles(dt, audio_energy)
 
-        # Update and draw particles
-        self._update_particles(dt, audio_energy)
         self._draw_particles(painter)
 
         # Draw status text
@@ -124,24 +139,25 @@ class ParticleStyle(BaseWaveformStyle):
         center_x = rect.width() // 2
         center_y = rect.height() // 2 - 5
 
-        # Emit particles in a vortex pattern
-        vortex_particles = 4
-        for i in range(vortex_particles):
-            angle = (i / vortex_particles) * 2 * math.pi + self.animation_time * 2
-            radius = 30 + 10 * math.sin(self.animation_time * 3)
+        if self._frame_due():
+            # Emit particles in a vortex pattern
+            vortex_particles = 4
+            for i in range(vortex_particles):
+                angle = (i / vortex_particles) * 2 * math.pi + self.animation_time * 2
+                radius = 30 + 10 * math.sin(self.animation_time * 3)
 
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
+                x = center_x + radius * math.cos(angle)
+                y = center_y + radius * math.sin(angle)
 
-            # Velocity tangent to circle
-            vx = -math.sin(angle) * 50
-            vy = math.cos(angle) * 50
+                # Velocity tangent to circle
+                vx = -math.sin(angle) * 50
+                vy = math.cos(angle) * 50
 
-            particle = Particle(x, y, vx, vy)
-            particle.color_hue = (angle * 180 / math.pi + self.animation_time * 50) % 360
-            self.particles.append(particle)
+                particle = Particle(x, y, vx, vy)
+                particle.color_hue = (angle * 180 / math.pi + self.animation_time * 50) % 360
+                self.particles.append(particle)
 
-        self._update_particles(dt, 0.5, vortex_mode=True)
+            self._update_particles(dt, 0.5, vortex_mode=True)
         self._draw_particles(painter)
         self._draw_text(painter, rect, message)
 
@@ -149,40 +165,41 @@ class ParticleStyle(BaseWaveformStyle):
         """Draw particles converging to center."""
         dt = 1/30
         
-        # Emit particles from edges - multiple per frame for density
-        particles_per_frame = random.randint(2, 4)
-        for _ in range(particles_per_frame):
-            # Pick a random edge
-            edge = random.randint(0, 3)
-            if edge == 0:   # Top
-                x = random.uniform(0, self.width)
-                y = -10
-            elif edge == 1: # Right
-                x = self.width + 10
-                y = random.uniform(0, self.height)
-            elif edge == 2: # Bottom
-                x = random.uniform(0, self.width)
-                y = self.height + 10
-            else:           # Left
-                x = -10
-                y = random.uniform(0, self.height)
-            
-            # Initial velocity towards center
-            center_x = self.width // 2
-            center_y = self.height // 2
-            angle = math.atan2(center_y - y, center_x - x)
-            
-            # Faster initial speed for rapid convergence
-            speed = random.uniform(200, 400)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            
-            particle = Particle(x, y, vx, vy)
-            # Full spectrum of colors for transcription
-            particle.color_hue = random.uniform(0, 360) 
-            self.particles.append(particle)
+        if self._frame_due():
+            # Emit particles from edges - multiple per frame for density
+            particles_per_frame = random.randint(2, 4)
+            for _ in range(particles_per_frame):
+                # Pick a random edge
+                edge = random.randint(0, 3)
+                if edge == 0:   # Top
+                    x = random.uniform(0, self.width)
+                    y = -10
+                elif edge == 1: # Right
+                    x = self.width + 10
+                    y = random.uniform(0, self.height)
+                elif edge == 2: # Bottom
+                    x = random.uniform(0, self.width)
+                    y = self.height + 10
+                else:           # Left
+                    x = -10
+                    y = random.uniform(0, self.height)
+                
+                # Initial velocity towards center
+                center_x = self.width // 2
+                center_y = self.height // 2
+                angle = math.atan2(center_y - y, center_x - x)
+                
+                # Faster initial speed for rapid convergence
+                speed = random.uniform(200, 400)
+                vx = math.cos(angle) * speed
+                vy = math.sin(angle) * speed
+                
+                particle = Particle(x, y, vx, vy)
+                # Full spectrum of colors for transcription
+                particle.color_hue = random.uniform(0, 360) 
+                self.particles.append(particle)
 
-        self._update_particles(dt, 0.3, converge_mode=True)
+            self._update_particles(dt, 0.3, converge_mode=True)
         self._draw_particles(painter)
         self._draw_text(painter, rect, message)
 
@@ -210,8 +227,7 @@ class ParticleStyle(BaseWaveformStyle):
 
         # Status text with fade
         painter.setPen(QColor(255, 255, 255, alpha))
-        font = QFont("Segoe UI", 10)
-        painter.setFont(font)
+        painter.setFont(self._text_font)
         text_rect = QRect(0, rect.height() - 25, rect.width(), 20)
         painter.drawText(text_rect, 0x0004 | 0x0080, message)
 
@@ -352,6 +368,25 @@ class ParticleStyle(BaseWaveformStyle):
         if len(self.particles) > self.max_particles:
             self.particles = self.particles[-self.max_particles:]
 
+    def _particle_paint(self, particle: Particle) -> Tuple[QBrush, QPen]:
+        """Get the cached brush and glow pen for a particle's quantized hue and life.
+
+        Colors are sampled at the middle of each bucket, so they stay within
+        half a step of Particle.get_qcolor().
+        """
+        life = max(0.0, min(1.0, particle.life))
+        key = (int(particle.color_hue % 360 * HUE_BUCKETS / 360) % HUE_BUCKETS,
+               min(LIFE_BUCKETS - 1, int(life * LIFE_BUCKETS)))
+        paint = self._bucket_paint.get(key)
+        if paint is None:
+            hue = int((key[0] + 0.5) * 360 / HUE_BUCKETS)
+            value = int((key[1] + 0.5) / LIFE_BUCKETS * 230 + 25)
+            color = QColor.fromHsv(hue, 200, value)
+            glow_color = QColor(color)
+            glow_color.setAlpha(100)
+            paint = self._bucket_paint[key] = (QBrush(color), QPen(glow_color, 1))
+        return paint
+
     def _draw_particles(self, painter: QPainter):
         """Draw all particles."""
         painter.setPen(Qt.PenStyle.NoPen)
@@ -362,17 +397,15 @@ class ParticleStyle(BaseWaveformStyle):
                 if not hasattr(particle, 'x') or not hasattr(particle, 'y'):
                     continue
                     
-                color = particle.get_qcolor()
-                painter.setBrush(color)
+                brush, glow_pen = self._particle_paint(particle)
+                painter.setBrush(brush)
                 
                 size = particle.size * particle.life
                 painter.drawEllipse(QRectF(particle.x - size, particle.y - size, size * 2, size * 2))
                 
                 if self.glow_effect and particle.life > 0.5:
-                    glow_color = QColor(color)
-                    glow_color.setAlpha(100)
                     painter.setBrush(Qt.BrushStyle.NoBrush)
-                    painter.setPen(QPen(glow_color, 1))
+                    painter.setPen(glow_pen)
                     glow_size = size + 1
                     painter.drawEllipse(QRectF(particle.x - glow_size, particle.y - glow_size, glow_size * 2, glow_size * 2))
                     painter.setPen(Qt.PenStyle.NoPen)
@@ -385,10 +418,9 @@ class ParticleStyle(BaseWaveformStyle):
     def _draw_text(self, painter: QPainter, rect: QRect, message: str):
         """Draw status text."""
         painter.setPen(self._hex_to_qcolor(self.text_color))
-        font = QFont("Segoe UI", 10, QFont.Weight.Bold)
-        painter.setFont(font)
+        painter.setFont(self._bold_text_font)
         text_rect = QRect(0, rect.height() - 25, rect.width(), 20)
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, message)
+        painter.drawText(text_rect, _ALIGN_CENTER, message)
 
     def _init_cancel_particles(self, rect: QRect):
         """Create an outward burst for cancel animation."""
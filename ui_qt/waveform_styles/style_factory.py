@@ -1,24 +1,43 @@
 """
 Style factory for creating waveform visualization styles.
 """
-from typing import Dict, Any, Optional
+import importlib
+from typing import Dict, Any, Optional, Union
 from .base_style import BaseWaveformStyle
-from .particle_style import ParticleStyle
 
 
-# Registry of available styles
-_style_registry: Dict[str, type] = {
-    'particle': ParticleStyle,
+# Registry of available styles. Built-in styles are registered as
+# "module:Class" paths and only imported when first requested.
+_style_registry: Dict[str, Union[type, str]] = {
+    'particle': '.particle_style:ParticleStyle',
 }
 
 
+def _resolve_style(style_name: str) -> type:
+    """Get the style class for a registered name, importing it on first use.
+
+    Args:
+        style_name: Name of a registered style
+
+    Returns:
+        The style class
+    """
+    style_class = _style_registry[style_name]
+    if isinstance(style_class, str):
+        module_name, class_name = style_class.split(':')
+        module = importlib.import_module(module_name, __package__)
+        style_class = getattr(module, class_name)
+        _style_registry[style_name] = style_class
+    return style_class
+
+
 def get_available_styles() -> Dict[str, type]:
     """Get dictionary of all available styles.
 
     Returns:
         Dictionary mapping style names to style classes
     """
-    return _style_registry.copy()
+    return {name: _resolve_style(name) for name in _style_registry}
 
 
 def create_style(style_name: str, width: int, height: int, config: Optional[Dict[str, Any]] = None) -> BaseWaveformStyle:
@@ -39,7 +58,7 @@ def create_style(style_name: str, width: int, height: int, config: Optional[Dict
     if style_name not in _style_registry:
         raise ValueError(f"Unknown style '{style_name}'. Available styles: {list(_style_registry.keys())}")
 
-    style_class = _style_registry[style_name]
+    style_class = _resolve_style(style_name)
 
     # Get default config if none provided
     if config is None:
@@ -3,7 +3,8 @@ Modern button components for PyQt6 UI.
 """
 from PyQt6.QtWidgets import QPushButton
 from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal
-from PyQt6.QtGui import QFont
+
+from ui_qt.utils.fonts import get_font
 
 
 class ModernButton(QPushButton):
@@ -15,7 +16,7 @@ class ModernButton(QPushButton):
         """Initialize modern button."""
         super().__init__(text, parent)
         self.setMinimumHeight(44) # Increased height
-        self.setFont(QFont("Segoe UI", 12)) # Increased font size
+        self.setFont(get_font(12)) # Increased font size
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
@@ -49,8 +50,7 @@ class PrimaryButton(ModernButton):
         """Initialize primary button."""
         super().__init__(text, parent)
         self.setObjectName("primaryButton")
-        self.setMinimumHeight(48)
-        self.setMinimumWidth(140)
+        self.setMinimumSize(140, 48)
 
 
 class DangerButton(ModernButton):
@@ -60,8 +60,7 @@ class DangerButton(ModernButton):
         """Initialize danger button."""
         super().__init__(text, parent)
         self.setObjectName("dangerButton")
-        self.setMinimumHeight(48)
-        self.setMinimumWidth(140)
+        self.setMinimumSize(140, 48)
 
 
 class SuccessButton(ModernButton):
@@ -71,8 +70,7 @@ class SuccessButton(ModernButton):
         """Initialize success button."""
         super().__init__(text, parent)
         self.setObjectName("successButton")
-        self.setMinimumHeight(48)
-        self.setMinimumWidth(140)
+        self.setMinimumSize(140, 48)
 
 
 class IconButton(ModernButton):
@@ -83,6 +81,5 @@ class IconButton(ModernButton):
         super().__init__(parent=parent)
         if icon:
             self.setIcon(icon)
-        self.setMinimumSize(44, 44)
-        self.setMaximumSize(44, 44)
+        self.setFixedSize(44, 44)
         self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
@@ -3,15 +3,17 @@ History sidebar widget for displaying transcription history and saved recordings
 Collapsible sidebar panel that slides in/out from the right side of the main window.
 """
 import logging
-from typing import Optional, Callable, List
+from functools import partial
+from typing import Optional, Callable, List, Dict
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QScrollArea, QFrame, QMenu, QSizePolicy, QApplication
+    QScrollArea, QFrame, QMenu, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, QSize
-from PyQt6.QtGui import QFont, QCursor
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QPropertyAnimation, QEasingCurve, QSize, QPoint
+from PyQt6.QtGui import QFont, QCursor, QGuiApplication
 
 from history_manager import HistoryEntry, RecordingInfo, history_manager
+from ui_qt.utils.fonts import get_font
 
 
 class HistoryItemWidget(QFrame):
@@ -46,7 +48,7 @@ class HistoryItemWidget(QFrame):
         # Timestamp
         self.timestamp_label = QLabel(self.entry.formatted_timestamp)
         self.timestamp_label.setObjectName("historyTimestamp")
-        self.timestamp_label.setFont(QFont("Segoe UI", 10))
+        self.timestamp_label.setFont(get_font(10))
         top_row.addWidget(self.timestamp_label)
         
         top_row.addStretch()
@@ -54,11 +56,12 @@ class HistoryItemWidget(QFrame):
         # Model badge
         self.model_badge = QLabel(self._format_model_name(self.entry.model))
         self.model_badge.setObjectName("modelBadge")
-        self.model_badge.setFont(QFont("Segoe UI", 9))
+        self.model_badge.setFont(get_font(9))
         top_row.addWidget(self.model_badge)
         
         # Audio indicator if recording exists
-        if self.entry.audio_file:
+        self.shows_audio = bool(self.entry.audio_file)
+        if self.shows_audio:
             audio_indicator = QLabel("🎤")
             audio_indicator.setToolTip("Audio recording available")
             top_row.addWidget(audio_indicator)
@@ -69,7 +72,7 @@ class HistoryItemWidget(QFrame):
         self.preview_label = QLabel(self.entry.preview_text)
         self.preview_label.setObjectName("historyPreview")
         self.preview_label.setWordWrap(True)
-        self.preview_label.setFont(QFont("Segoe UI", 11))
+        self.preview_label.setFont(get_font(11))
         self.preview_label.setMaximumHeight(60)
         layout.addWidget(self.preview_label)
     
@@ -113,6 +116,7 @@ class HistoryItemWidget(QFrame):
             }
         """)
     
+    @pyqtSlot(QPoint)
     def _show_context_menu(self, pos):
         """Show context menu."""
         menu = QMenu(self)
@@ -142,7 +146,7 @@ class HistoryItemWidget(QFrame):
         
         # Copy action
         copy_action = menu.addAction("Copy Text")
-        copy_action.triggered.connect(lambda: self.copy_requested.emit(self.entry.id))
+        copy_action.triggered.connect(self._emit_copy_requested)
         
         # Re-transcribe action (only if audio exists)
         if self.entry.audio_file:
@@ -150,17 +154,27 @@ class HistoryItemWidget(QFrame):
             if audio_path:
                 retranscribe_action = menu.addAction("Re-transcribe")
                 retranscribe_action.triggered.connect(
-                    lambda: self.retranscribe_requested.emit(audio_path)
+                    partial(self.retranscribe_requested.emit, audio_path)
                 )
         
         menu.addSeparator()
         
         # Delete action
         delete_action = menu.addAction("Delete")
-        delete_action.triggered.connect(lambda: self.delete_requested.emit(self.entry.id))
+        delete_action.triggered.connect(self._emit_delete_requested)
         
         menu.exec(self.mapToGlobal(pos))
     
+    @pyqtSlot()
+    def _emit_copy_requested(self):
+        """Emit copy request for this entry."""
+        self.copy_requested.emit(self.entry.id)
+    
+    @pyqtSlot()
+    def _emit_delete_requested(self):
+        """Emit delete request for this entry."""
+        self.delete_requested.emit(self.entry.id)
+    
     def mousePressEvent(self, event):
         """Handle click to view full transcription."""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -194,13 +208,13 @@ class RecordingItemWidget(QFrame):
         # Timestamp
         self.timestamp_label = QLabel(self.recording.formatted_timestamp)
         self.timestamp_label.setObjectName("recordingTimestamp")
-        self.timestamp_label.setFont(QFont("Segoe UI", 11))
+        self.timestamp_label.setFont(get_font(11))
         info_layout.addWidget(self.timestamp_label)
         
         # File size
         self.size_label = QLabel(self.recording.formatted_size)
         self.size_label.setObjectName("recordingSize")
-        self.size_label.setFont(QFont("Segoe UI", 9))
+        self.size_label.setFont(get_font(9))
         info_layout.addWidget(self.size_label)
         
         layout.addLayout(info_layout)
@@ -211,11 +225,14 @@ class RecordingItemWidget(QFrame):
         self.retranscribe_btn.setObjectName("retranscribeBtn")
         self.retranscribe_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.retranscribe_btn.setFixedHeight(32)
-        self.retranscribe_btn.clicked.connect(
-            lambda: self.retranscribe_requested.emit(self.recording.file_path)
-        )
+        self.retranscribe_btn.clicked.connect(self._emit_retranscribe_requested)
         layout.addWidget(self.retranscribe_btn)
     
+    @pyqtSlot()
+    def _emit_retranscribe_requested(self):
+        """Emit re-transcribe request for this recording."""
+        self.retranscribe_requested.emit(self.recording.file_path)
+    
     def _apply_style(self):
         """Apply custom styling."""
         self.setStyleSheet("""
@@ -267,6 +284,11 @@ class HistorySidebar(QWidget):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
         self._is_expanded = False
+        self._clipboard = QGuiApplication.clipboard()  # Application-wide, fetch once
+
+        # History item widgets by entry id, for incremental updates
+        self._history_items: Dict[str, HistoryItemWidget] = {}
+        self._no_history_label: Optional[QLabel] = None
         
         self._setup_ui()
         self._apply_style()
@@ -295,7 +317,7 @@ class HistorySidebar(QWidget):
         
         header_label = QLabel("History")
         header_label.setObjectName("sidebarHeader")
-        header_label.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        header_label.setFont(get_font(16, QFont.Weight.Bold))
         header_layout.addWidget(header_label)
         
         header_layout.addStretch()
@@ -312,7 +334,7 @@ class HistorySidebar(QWidget):
         # Recordings section
         recordings_header = QLabel("RECENT RECORDINGS")
         recordings_header.setObjectName("sectionHeader")
-        recordings_header.setFont(QFont("Segoe UI", 11, QFont.Weight.DemiBold))
+        recordings_header.setFont(get_font(11, QFont.Weight.DemiBold))
         content_layout.addWidget(recordings_header)
         
         # Recordings container
@@ -329,7 +351,7 @@ class HistorySidebar(QWidget):
         # History section
         history_header = QLabel("TRANSCRIPTION HISTORY")
         history_header.setObjectName("sectionHeader")
-        history_header.setFont(QFont("Segoe UI", 11, QFont.Weight.DemiBold))
+        history_header.setFont(get_font(11, QFont.Weight.DemiBold))
         content_layout.addWidget(history_header)
         
         # Scrollable history list
@@ -413,6 +435,7 @@ class HistorySidebar(QWidget):
         
         self.logger.debug("Sidebar expanded")
     
+    @pyqtSlot()
     def collapse(self):
         """Collapse the sidebar."""
         if not self._is_expanded:
@@ -462,7 +485,7 @@ class HistorySidebar(QWidget):
         
         for recording in recordings:
             item = RecordingItemWidget(recording)
-            item.retranscribe_requested.connect(self.retranscribe_requested.emit)
+            item.retranscribe_requested.connect(self.retranscribe_requested)
             self.recordings_container.addWidget(item)
     
     def _load_history(self):
@@ -472,24 +495,79 @@ class HistorySidebar(QWidget):
             item = self.history_list_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
+        self._history_items.clear()
+        self._no_history_label = None
         
         entries = history_manager.get_history()
         
         if not entries:
-            no_history_label = QLabel("No transcription history")
-            no_history_label.setStyleSheet("color: #636366; font-size: 12px;")
-            no_history_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.history_list_layout.addWidget(no_history_label)
+            self._show_no_history_label()
             return
         
         for entry in entries:
-            item = HistoryItemWidget(entry)
-            item.clicked.connect(self._on_entry_clicked)
-            item.copy_requested.connect(self._on_copy_requested)
-            item.delete_requested.connect(self._on_delete_requested)
-            item.retranscribe_requested.connect(self.retranscribe_requested.emit)
-            self.history_list_layout.addWidget(item)
+            self.history_list_layout.addWidget(self._create_history_item(entry))
+
+    def _create_history_item(self, entry: HistoryEntry) -> HistoryItemWidget:
+        """Create and track the widget for a history entry."""
+        item = HistoryItemWidget(entry)
+        item.clicked.connect(self._on_entry_clicked)
+        item.copy_requested.connect(self._on_copy_requested)
+        item.delete_requested.connect(self._on_delete_requested)
+        item.retranscribe_requested.connect(self.retranscribe_requested)
+        self._history_items[entry.id] = item
+        return item
+
+    def _show_no_history_label(self):
+        """Show the placeholder for an empty history."""
+        self._no_history_label = QLabel("No transcription history")
+        self._no_history_label.setStyleSheet("color: #636366; font-size: 12px;")
+        self._no_history_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.history_list_layout.addWidget(self._no_history_label)
+
+    def add_entry(self, entry: HistoryEntry):
+        """Show a new history entry at the top of the list without reloading it.
+
+        Args:
+            entry: The newly added entry.
+        """
+        if self._no_history_label is not None:
+            self.history_list_layout.removeWidget(self._no_history_label)
+            self._no_history_label.deleteLater()
+            self._no_history_label = None
+
+        self.history_list_layout.insertWidget(0, self._create_history_item(entry))
+
+        # A new entry may come with a saved recording, and saving it may have
+        # rotated out older recordings and cleared their entries' audio_file
+        if entry.audio_file:
+            self._load_recordings()
+            for item in list(self._history_items.values()):
+                if item.shows_audio and not item.entry.audio_file:
+                    self._replace_history_item(item)
+
+    def _replace_history_item(self, item: HistoryItemWidget):
+        """Rebuild a history entry's widget in place, e.g. after its recording is removed."""
+        index = self.history_list_layout.indexOf(item)
+        self.history_list_layout.removeWidget(item)
+        item.deleteLater()
+        self.history_list_layout.insertWidget(index, self._create_history_item(item.entry))
+
+    def remove_entry(self, entry_id: str):
+        """Remove a history entry's widget without reloading the list.
+
+        Args:
+            entry_id: ID of the removed entry.
+        """
+        item = self._history_items.pop(entry_id, None)
+        if item is None:
+            return
+
+        self.history_list_layout.removeWidget(item)
+        item.deleteLater()
+        if not self._history_items:
+            self._show_no_history_label()
     
+    @pyqtSlot(str)
     def _on_entry_clicked(self, entry_id: str):
         """Handle history entry click."""
         entry = history_manager.get_entry_by_id(entry_id)
@@ -497,23 +575,24 @@ class HistorySidebar(QWidget):
             self.entry_selected.emit(entry_id)
             self.logger.debug(f"Entry selected: {entry_id[:8]}...")
     
+    @pyqtSlot(str)
     def _on_copy_requested(self, entry_id: str):
         """Handle copy request."""
         entry = history_manager.get_entry_by_id(entry_id)
         if entry:
             try:
-                clipboard = QApplication.clipboard()
-                clipboard.setText(entry.text)
+                self._clipboard.setText(entry.text)
                 self.entry_copied.emit(entry_id)
                 self.logger.info(f"Copied entry to clipboard: {entry_id[:8]}...")
             except Exception as e:
                 self.logger.error(f"Failed to copy to clipboard: {e}")
     
+    @pyqtSlot(str)
     def _on_delete_requested(self, entry_id: str):
         """Handle delete request."""
         if history_manager.delete_entry(entry_id):
             self.entry_deleted.emit(entry_id)
-            self.refresh()  # Refresh the list
+            self.remove_entry(entry_id)
             self.logger.info(f"Deleted entry: {entry_id[:8]}...")
 
 